@@ -1,12 +1,18 @@
 """SQLite cache for document embeddings."""
 
 import hashlib
+import os
 import sqlite3
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 import numpy as np
 
+# Packed (N, D) float32 matrix of L2-normalised embeddings, stored next to
+# the space database; embeddings.row_idx gives each file's row
+EMBEDDING_MATRIX_NAME = 'embeddings.f32'
+
 
 def init_embeddings_table(conn: sqlite3.Connection) -> None:
     """Create embeddings table if it doesn't exist.
@@ -20,12 +26,29 @@ def init_embeddings_table(conn: sqlite3.Connection) -> None:
             embedding BLOB NOT NULL,
             model TEXT NOT NULL,
             content_hash TEXT NOT NULL,
-            created_at TEXT NOT NULL
+            created_at TEXT NOT NULL,
+            row_idx INTEGER
         )
     """)
     conn.commit()
 
 
+def _has_row_idx(conn: sqlite3.Connection) -> bool:
+    """Whether the embeddings table has the row_idx column."""
+    return any(row[1] == 'row_idx' for row in conn.execute("PRAGMA table_info(embeddings)"))
+
+
+def migrate_embeddings_table(conn: sqlite3.Connection) -> None:
+    """Add the row_idx column to embeddings tables created before it existed.
+
+    Args:
+        conn: SQLite connection to space database (must be writable)
+    """
+    if not _has_row_idx(conn):
+        conn.execute("ALTER TABLE embeddings ADD COLUMN row_idx INTEGER")
+        conn.commit()
+
+
 def get_cached_embedding(conn: sqlite3.Connection, file_id: str) -> Optional[np.ndarray]:
     """Retrieve cached embedding for a file.
 
@@ -70,6 +93,7 @@ def save_embedding(
     embedding_bytes = embedding.astype(np.float32).tobytes()
     created_at = datetime.now().isoformat()
 
+    # The replaced row gets row_idx NULL, marking the packed matrix stale
     conn.execute("""
         INSERT OR REPLACE INTO embeddings (file_id, embedding, model, content_hash, created_at)
         VALUES (?, ?, ?, ?, ?)
@@ -141,3 +165,134 @@ def load_all_embeddings(conn: sqlite3.Connection) -> dict[str, np.ndarray]:
         embeddings[file_id] = embedding
 
     return embeddings
+
+
+def _embedding_matrix_path(conn: sqlite3.Connection) -> Optional[Path]:
+    """Path of the packed matrix file for a connection's database (None if in-memory)."""
+    for _, name, file in conn.execute("PRAGMA database_list"):
+        if name == 'main':
+            return Path(file).with_name(EMBEDDING_MATRIX_NAME) if file else None
+    return None
+
+
+def write_embedding_matrix(conn: sqlite3.Connection, path: Path, count: int, dim: int) -> None:
+    """Dump all cached embeddings into a packed matrix file and number their rows.
+
+    Rows keep the embeddings table's scan order and are L2-normalised. The
+    file is written beside the target and renamed into place, so readers
+    never map a partial matrix.
+
+    Args:
+        conn: SQLite connection to space database
+        path: Matrix file to (re)write
+        count: Number of embeddings
+        dim: Embedding dimension
+    """
+    # Hold the write lock so no embedding changes between dump and numbering
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        matrix = np.memmap(tmp_path, dtype=np.float32, mode='w+', shape=(count, dim))
+        ids = []
+        for row in conn.execute("SELECT file_id, embedding FROM embeddings LIMIT ?", (count,)):
+            matrix[len(ids)] = np.frombuffer(row[1], dtype=np.float32)
+            ids.append(row[0])
+        if len(ids) != count:
+            raise sqlite3.OperationalError("embeddings changed while writing matrix")
+
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix.flush()
+        del matrix
+        os.replace(tmp_path, path)
+
+        conn.executemany(
+            "UPDATE embeddings SET row_idx = ? WHERE file_id = ?",
+            ((i, file_id) for i, file_id in enumerate(ids))
+        )
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+
+def _embedding_matrix_state(conn: sqlite3.Connection) -> Optional[tuple[Path, int, int, bool]]:
+    """Locate the packed matrix and check it against the embeddings table.
+
+    Returns:
+        Tuple of (path, count, dim, fresh); None if the database is
+        in-memory, lacks row_idx, has no embeddings or mixes sizes
+    """
+    path = _embedding_matrix_path(conn)
+    if path is None or not _has_row_idx(conn):
+        return None
+
+    count, numbered, max_idx, min_size, max_size = conn.execute("""
+        SELECT COUNT(*), COUNT(DISTINCT row_idx), MAX(row_idx),
+               MIN(LENGTH(embedding)), MAX(LENGTH(embedding))
+        FROM embeddings
+    """).fetchone()
+    if count == 0 or min_size != max_size or max_size % 4:
+        return None
+
+    fresh = (
+        numbered == count
+        and max_idx == count - 1
+        and path.exists()
+        and path.stat().st_size == count * max_size
+    )
+    return path, count, max_size // 4, fresh
+
+
+def refresh_embedding_matrix(conn: sqlite3.Connection) -> bool:
+    """Migrate the table and rewrite the packed matrix if embeddings changed.
+
+    Called by the embedding writer; the matrix is only a cache, so failing
+    to write it is not an error (readers fall back to the BLOB column).
+
+    Args:
+        conn: SQLite connection to space database (must be writable)
+
+    Returns:
+        True if the matrix is up to date afterwards
+    """
+    try:
+        migrate_embeddings_table(conn)
+        state = _embedding_matrix_state(conn)
+        if state is None:
+            return False
+        path, count, dim, fresh = state
+        if not fresh:
+            write_embedding_matrix(conn, path, count, dim)
+    except (OSError, sqlite3.OperationalError):
+        return False
+    return True
+
+
+def load_embedding_matrix(conn: sqlite3.Connection) -> Optional[tuple[list[str], np.ndarray]]:
+    """Memory-map the packed matrix of a space's embeddings.
+
+    Read-only: nothing is written here. The matrix is used only if it
+    matches the embeddings table (see refresh_embedding_matrix).
+
+    Args:
+        conn: SQLite connection to space database
+
+    Returns:
+        Tuple of (file_ids, matrix) with matrix a read-only (N, D) float32
+        view of L2-normalised embeddings, row i belonging to file_ids[i];
+        None if the matrix is missing or stale
+    """
+    state = _embedding_matrix_state(conn)
+    if state is None or not state[3]:
+        return None
+    path, count, dim, _ = state
+
+    file_ids = [row[0] for row in conn.execute("SELECT file_id FROM embeddings ORDER BY row_idx")]
+    if len(file_ids) != count:
+        return None
+
+    return file_ids, np.asarray(np.memmap(path, dtype=np.float32, mode='r', shape=(count, dim)))
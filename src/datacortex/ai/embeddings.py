@@ -109,6 +109,7 @@ def compute_embeddings_for_space(space: str, force: bool = False) -> dict[str, n
         get_cached_embedding,
         save_embedding,
         get_stale_embeddings,
+        refresh_embedding_matrix,
     )
 
     conn = get_connection(space)
@@ -168,5 +169,8 @@ def compute_embeddings_for_space(space: str, force: bool = False) -> dict[str, n
         else:
             print("All embeddings up to date (using cache)")
 
+    # Keep the packed matrix read by search in step with the table
+    refresh_embedding_matrix(conn)
+
     conn.close()
     return embeddings
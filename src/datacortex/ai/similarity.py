@@ -72,21 +72,19 @@ def find_similar_pairs(
     if len(file_ids) == 0:
         return []
 
-    pairs = []
+    # Upper triangle only to avoid duplicates; nonzero yields row-major order
+    rows, cols = np.nonzero(np.triu(matrix >= threshold, k=1))
+    similarities = matrix[rows, cols]
 
-    # Iterate upper triangle to avoid duplicates
-    n = len(file_ids)
-    for i in range(n):
-        for j in range(i + 1, n):
-            similarity = matrix[i][j]
+    # Sort by similarity descending (stable, so ties keep row-major order)
+    order = np.argsort(-similarities, kind='stable')
 
-            if similarity >= threshold:
-                pairs.append((file_ids[i], file_ids[j], float(similarity)))
-
-    # Sort by similarity descending
-    pairs.sort(key=lambda x: -x[2])
-
-    return pairs
+    return [
+        (file_ids[i], file_ids[j], similarity)
+        for i, j, similarity in zip(
+            rows[order].tolist(), cols[order].tolist(), similarities[order].tolist()
+        )
+    ]
 
 
 def find_most_similar(
@@ -113,15 +111,10 @@ def find_most_similar(
     # Find index of target file
     idx = file_ids.index(file_id)
 
-    # Get similarity scores for this file
-    similarities = matrix[idx]
-
-    # Create list of (file_id, similarity) pairs, excluding self
-    similar = []
-    for i, fid in enumerate(file_ids):
-        if i != idx:
-            similar.append((fid, float(similarities[i])))
+    # Get similarity scores for this file, excluding self
+    others = np.delete(np.arange(len(file_ids)), idx)
+    similarities = np.asarray(matrix[idx], dtype=np.float64)[others]
 
-    # Sort by similarity descending and return top_k
-    similar.sort(key=lambda x: -x[1])
-    return similar[:top_k]
+    # Sort by similarity descending (stable, so ties keep file order) and return top_k
+    order = np.argsort(-similarities, kind='stable')[:top_k]
+    return [(file_ids[i], similarity) for i, similarity in zip(others[order].tolist(), similarities[order].tolist())]
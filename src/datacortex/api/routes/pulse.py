@@ -9,6 +9,7 @@ from ...core.config import load_config
 from ...pulse.generator import (
     compute_changes,
     generate_pulse,
+    get_pulse_path,
     list_pulses,
     load_pulse,
     save_pulse,
@@ -28,7 +29,7 @@ async def get_pulses():
 
     pulses = []
     for pulse_id in pulse_ids:
-        pulse_path = pulse_dir / f"{pulse_id}.json"
+        pulse_path = get_pulse_path(pulse_dir, pulse_id)
         try:
             pulse = load_pulse(pulse_path)
             pulses.append({
@@ -50,9 +51,9 @@ async def get_pulse(pulse_id: str):
     """Get graph data for a specific pulse."""
     config = load_config()
     pulse_dir = Path(config.pulse.directory)
-    pulse_path = pulse_dir / f"{pulse_id}.json"
+    pulse_path = get_pulse_path(pulse_dir, pulse_id)
 
-    if not pulse_path.exists():
+    if pulse_path is None:
         raise HTTPException(status_code=404, detail="Pulse not found")
 
     pulse = load_pulse(pulse_path)
@@ -74,12 +75,12 @@ async def get_pulse_diff(pulse_a: str, pulse_b: str):
     config = load_config()
     pulse_dir = Path(config.pulse.directory)
 
-    path_a = pulse_dir / f"{pulse_a}.json"
-    path_b = pulse_dir / f"{pulse_b}.json"
+    path_a = get_pulse_path(pulse_dir, pulse_a)
+    path_b = get_pulse_path(pulse_dir, pulse_b)
 
-    if not path_a.exists():
+    if path_a is None:
         raise HTTPException(status_code=404, detail=f"Pulse {pulse_a} not found")
-    if not path_b.exists():
+    if path_b is None:
         raise HTTPException(status_code=404, detail=f"Pulse {pulse_b} not found")
 
     pulse_obj_a = load_pulse(path_a)
@@ -580,11 +580,12 @@ def opportunities(space: Optional[str], top: int):
 @click.option('--space', '-s', multiple=True, help='Spaces to search (can specify multiple)')
 @click.option('--top', '-t', default=5, help='Number of results (default: 5)')
 @click.option('--no-expand', is_flag=True, help='Skip graph expansion')
-def search(query: str, space: tuple[str], top: int, no_expand: bool):
+@click.option('--quantize', is_flag=True, help='Score against int8 embeddings (less memory)')
+def search(query: str, space: tuple[str], top: int, no_expand: bool, quantize: bool):
     """Search knowledge base using RAG retrieval."""
     from datetime import datetime
     from ..qa.retriever import search as do_search
-    from ..qa.formatter import format_search_results
+    from ..qa.formatter import format_search_results_stream
 
     config = load_config()
 
@@ -612,16 +613,15 @@ def search(query: str, space: tuple[str], top: int, no_expand: bool):
         query=query,
         spaces=spaces_to_search,
         top_k=top,
-        expand=not no_expand
+        expand=not no_expand,
+        quantize=quantize
     )
 
-    # Format
-    formatted = format_search_results(results)
-
-    # Write to temp file
+    # Format straight into a temp file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = Path(f"/tmp/datacortex_search_{timestamp}.txt")
-    output_path.write_text(formatted)
+    with open(output_path, 'wb') as f:
+        format_search_results_stream(results, f)
 
     click.echo(f"Search results written to: {output_path}", err=True)
     click.echo(f"\n{output_path}")
@@ -1,5 +1,7 @@
 """Configuration management for Datacortex."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +10,12 @@ from pydantic import BaseModel, Field
 
 from .database import DATA_ROOT
 
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ServerConfig(BaseModel):
     """Server configuration."""
@@ -64,15 +72,12 @@ def load_config(config_dir: Optional[Path] = None) -> DatacortexConfig:
     # Load base config
     base_config = config_dir / "datacortex.yaml"
     if base_config.exists():
-        with open(base_config) as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = _read_yaml(base_config)
 
     # Overlay local config
     local_config = config_dir / "datacortex.local.yaml"
     if local_config.exists():
-        with open(local_config) as f:
-            local_data = yaml.safe_load(f) or {}
-            config_data = deep_merge(config_data, local_data)
+        config_data = deep_merge(config_data, _read_yaml(local_config))
 
     # Expand ~ in datacore_root
     if "datacore_root" in config_data:
@@ -81,6 +86,19 @@ def load_config(config_dir: Optional[Path] = None) -> DatacortexConfig:
     return DatacortexConfig(**config_data)
 
 
+@lru_cache(maxsize=8)
+def _parse_yaml_cached(path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML file, memoised per file version."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def _read_yaml(path: Path) -> dict:
+    """Read a YAML mapping, re-parsing only when the file changes."""
+    stat = path.stat()
+    return copy.deepcopy(_parse_yaml_cached(path, stat.st_mtime_ns, stat.st_size))
+
+
 def deep_merge(base: dict, overlay: dict) -> dict:
     """Recursively merge overlay into base."""
     result = base.copy()
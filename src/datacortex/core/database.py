@@ -61,6 +61,22 @@ except ImportError:
     SPACES = _discover_spaces()
 
 
+# Per-connection tuning for read-heavy analysis: memory-map up to 256 MB of
+# the database file, allow a 64 MB page cache, keep temp tables in memory
+_CONNECTION_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply read-oriented PRAGMAs to a new connection."""
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
 def get_connection(space: Optional[str] = None) -> sqlite3.Connection:
     """Get database connection for a space.
 
@@ -71,7 +87,7 @@ def get_connection(space: Optional[str] = None) -> sqlite3.Connection:
         SQLite connection with row factory set
     """
     if HAS_ZETTEL_DB:
-        return _get_connection(space)
+        return _configure_connection(_get_connection(space))
 
     # Fallback implementation
     if space is None:
@@ -84,7 +100,7 @@ def get_connection(space: Optional[str] = None) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
-    return conn
+    return _configure_connection(conn)
 
 
 def get_available_spaces() -> list[str]:
@@ -97,9 +113,34 @@ def get_available_spaces() -> list[str]:
     return spaces
 
 
+def get_db_path(space: str) -> Optional[Path]:
+    """Get the knowledge database path for a space (None if unknown space)."""
+    if space not in SPACES:
+        return None
+    return SPACES[space]['path'] / '.datacore' / 'knowledge.db'
+
+
+def get_db_version(space: str) -> Optional[tuple]:
+    """Modification stamp of a space database, including its WAL file.
+
+    Returns:
+        Tuple of (mtime_ns, size) pairs, or None if the space is unknown
+    """
+    db_path = get_db_path(space)
+    if db_path is None:
+        return None
+
+    version = []
+    for path in (db_path, db_path.with_name(db_path.name + '-wal')):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        version.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
 def space_exists(space: str) -> bool:
     """Check if a space has a knowledge database."""
-    if space not in SPACES:
-        return False
-    db_path = SPACES[space]['path'] / '.datacore' / 'knowledge.db'
-    return db_path.exists()
+    db_path = get_db_path(space)
+    return db_path is not None and db_path.exists()
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NodeType(str, Enum):
@@ -29,7 +30,7 @@ class Node(BaseModel):
     maturity: Optional[str] = None
     is_stub: bool = False
     word_count: int = 0
-    tags: list[str] = Field(default_factory=list)
+    tags: tuple[str, ...] = ()
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -42,7 +43,12 @@ class Node(BaseModel):
 
 
 class Edge(BaseModel):
-    """A link between two documents."""
+    """A link between two documents.
+
+    Edges are immutable once built, so Graph's cached edge views stay valid.
+    """
+    model_config = ConfigDict(frozen=True)
+
     id: str
     source: str
     target: str
@@ -73,6 +79,45 @@ class Graph(BaseModel):
     generated_at: datetime = Field(default_factory=datetime.now)
     stats: GraphStats = Field(default_factory=GraphStats)
 
+    # Computed on first access and cached; treat nodes/edges as read-only after that
+
+    @cached_property
+    def node_id_set(self) -> frozenset[str]:
+        """IDs of all nodes in the graph."""
+        return frozenset(n.id for n in self.nodes)
+
+    @cached_property
+    def edge_id_set(self) -> frozenset[str]:
+        """IDs of all edges in the graph."""
+        return frozenset(e.id for e in self.edges)
+
+    @cached_property
+    def edges_resolved(self) -> list[Edge]:
+        """Edges whose target resolved to a document, in graph.edges order."""
+        return [e for e in self.edges if e.resolved]
+
+    @cached_property
+    def edge_arrays(self) -> tuple:
+        """Edges as (id_to_idx, src, tgt, resolved); see metrics._kernels.build_edge_arrays."""
+        from ..metrics._kernels import build_edge_arrays
+        return build_edge_arrays(self.nodes, self.edges)
+
+    @cached_property
+    def node_arrays(self) -> dict:
+        """Numeric node fields as NumPy arrays aligned with nodes.
+
+        See metrics._kernels.build_node_arrays. Cluster assignments are not
+        included since they may be computed after the graph is built.
+        """
+        from ..metrics._kernels import build_node_arrays
+        return build_node_arrays(self.nodes)
+
+    @cached_property
+    def tag_arrays(self) -> tuple:
+        """Node tags as (vocab, tag_idx, offsets); see metrics._kernels.build_tag_arrays."""
+        from ..metrics._kernels import build_tag_arrays
+        return build_tag_arrays(self.nodes)
+
 
 class PulseChanges(BaseModel):
     """Changes between two pulses."""
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Optional
 
 import numpy as np
@@ -284,7 +285,7 @@ def generate_digest(
         all_orphans.extend(orphans)
 
     # Sort by final score and take top N
-    all_pairs.sort(key=lambda p: -p.final_score)
+    all_pairs.sort(key=attrgetter('final_score'), reverse=True)
     all_pairs = all_pairs[:top_n]
 
     return DigestResult(
@@ -1,15 +1,15 @@
 """Gap detection logic for knowledge clusters."""
 
+import heapq
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from collections import Counter
 
 import numpy as np
-import networkx as nx
 
 from ..ai.embeddings import compute_embeddings_for_space
-from ..ai.similarity import cosine_similarity
-from ..core.database import get_connection, space_exists
+from ..core.database import space_exists
 from ..indexer.graph_builder import build_graph
 from ..metrics.clusters import compute_clusters
 
@@ -46,12 +46,14 @@ class GapsResult:
     generated_at: str
 
 
-def get_cluster_centroid(cluster_members: list[str], embeddings: dict) -> np.ndarray:
+def get_cluster_centroid(cluster_members: list[str], embeddings: dict, dim: int = 768) -> np.ndarray:
     """Compute average embedding of cluster members.
 
     Args:
         cluster_members: List of file IDs in cluster
         embeddings: Dict mapping file_id to embedding vector
+        dim: Embedding dimension, used for the zero vector of clusters
+            without embeddings (default 768)
 
     Returns:
         Centroid vector (average of member embeddings)
@@ -63,7 +65,7 @@ def get_cluster_centroid(cluster_members: list[str], embeddings: dict) -> np.nda
 
     if not member_embeddings:
         # Return zero vector if no embeddings found
-        return np.zeros(768)  # Default embedding dimension
+        return np.zeros(dim)
 
     # Average the embeddings
     centroid = np.mean(member_embeddings, axis=0)
@@ -82,8 +84,8 @@ def get_cluster_info(cluster_id: int, members: list, graph) -> ClusterInfo:
         ClusterInfo with size, hubs, and top tags
     """
     # Get top 5 by centrality (or degree as proxy)
-    sorted_members = sorted(members, key=lambda n: n.centrality or n.degree, reverse=True)
-    hub_docs = [node.title for node in sorted_members[:5]]
+    top_members = heapq.nlargest(5, members, key=lambda n: n.centrality or n.degree)
+    hub_docs = [node.title for node in top_members]
 
     # Count tags across all cluster members
     tag_counter = Counter()
@@ -138,58 +140,106 @@ def find_boundary_nodes(cluster_a_members, cluster_b_members, edges) -> list[str
     return sorted(list(boundary))
 
 
-def find_shared_tags(cluster_a_members, cluster_b_members) -> list[str]:
-    """Find tags that appear in both clusters.
+def get_cluster_tagset(members) -> frozenset[str]:
+    """Collect the set of tags used anywhere in a cluster.
 
     Args:
-        cluster_a_members: List of Node objects in cluster A
-        cluster_b_members: List of Node objects in cluster B
+        members: List of Node objects in the cluster
 
     Returns:
-        List of shared tag names
+        Frozen set of tag names
     """
-    tags_a = set()
-    for node in cluster_a_members:
-        tags_a.update(node.tags)
+    return frozenset().union(*(node.tags for node in members))
+
 
-    tags_b = set()
-    for node in cluster_b_members:
-        tags_b.update(node.tags)
+def find_shared_tags(tags_a: frozenset[str], tags_b: frozenset[str]) -> list[str]:
+    """Find tags that appear in both clusters.
 
-    shared = tags_a & tags_b
-    return sorted(list(shared))
+    Args:
+        tags_a: Tag set of cluster A (see get_cluster_tagset)
+        tags_b: Tag set of cluster B
 
+    Returns:
+        List of shared tag names
+    """
+    return sorted(tags_a & tags_b)
 
-def count_cross_links(cluster_a_members, cluster_b_members, edges) -> int:
-    """Count edges between the two clusters.
+
+def count_cross_link_matrix(cluster_ids: list[int], clusters: dict, edges) -> np.ndarray:
+    """Count edges between every pair of clusters in a single pass.
 
     Args:
-        cluster_a_members: List of Node objects in cluster A
-        cluster_b_members: List of Node objects in cluster B
+        cluster_ids: Ordered list of cluster IDs (defines matrix axes)
+        clusters: Dict mapping cluster_id to list of Node objects
         edges: List of Edge objects
 
     Returns:
-        Number of edges connecting the clusters
+        Symmetric KxK matrix where [i, j] is the number of edges
+        connecting cluster_ids[i] and cluster_ids[j]
     """
-    cluster_a_ids = {node.id for node in cluster_a_members}
-    cluster_b_ids = {node.id for node in cluster_b_members}
+    node_to_idx = {}
+    for idx, cluster_id in enumerate(cluster_ids):
+        for node in clusters[cluster_id]:
+            node_to_idx[node.id] = idx
 
-    cross_link_count = 0
+    matrix = np.zeros((len(cluster_ids), len(cluster_ids)), dtype=np.int64)
 
     for edge in edges:
         if not edge.resolved:
             continue
 
-        source_in_a = edge.source in cluster_a_ids
-        source_in_b = edge.source in cluster_b_ids
-        target_in_a = edge.target in cluster_a_ids
-        target_in_b = edge.target in cluster_b_ids
+        source_idx = node_to_idx.get(edge.source)
+        target_idx = node_to_idx.get(edge.target)
 
-        # Count if edge connects the two clusters
-        if (source_in_a and target_in_b) or (source_in_b and target_in_a):
-            cross_link_count += 1
+        if source_idx is None or target_idx is None or source_idx == target_idx:
+            continue
+
+        matrix[source_idx, target_idx] += 1
+        matrix[target_idx, source_idx] += 1
+
+    return matrix
+
+
+def score_cluster_pairs(
+    centroids: np.ndarray,
+    cross_links: np.ndarray,
+    sizes: np.ndarray,
+    min_gap_score: float
+) -> list[tuple[int, int, float, float, float]]:
+    """Score all cluster pairs at once and keep those above the threshold.
+
+    Args:
+        centroids: KxD matrix of cluster centroids
+        cross_links: KxK cross-link count matrix
+        sizes: Array of K cluster sizes
+        min_gap_score: Minimum gap score threshold
+
+    Callers pass only clusters large enough to report (see detect_gaps).
 
-    return cross_link_count
+    Returns:
+        List of (i, j, semantic_sim, link_density, gap_score) for i < j,
+        in the same row-major order as a nested pair loop
+    """
+    # Cosine similarity of all centroid pairs (zero centroids have no embeddings)
+    norms = np.linalg.norm(centroids, axis=1)
+    valid = norms > 0
+    normalized = centroids / np.where(valid, norms, 1.0)[:, None]
+    semantic_sim = normalized @ normalized.T
+
+    # Link density (actual / max possible)
+    max_possible_links = np.outer(sizes, sizes)
+    link_density = cross_links / np.maximum(max_possible_links, 1)
+
+    gap_score = semantic_sim - link_density
+
+    # Skip clusters without embeddings and pairs below threshold
+    mask = np.triu(np.outer(valid, valid), k=1) & (gap_score >= min_gap_score)
+
+    rows, cols = np.nonzero(mask)
+    return [
+        (i, j, float(semantic_sim[i, j]), float(link_density[i, j]), float(gap_score[i, j]))
+        for i, j in zip(rows.tolist(), cols.tolist())
+    ]
 
 
 def detect_gaps(spaces: list[str], min_gap_score: float = 0.3) -> GapsResult:
@@ -221,10 +271,11 @@ def detect_gaps(spaces: list[str], min_gap_score: float = 0.3) -> GapsResult:
     config = load_config()
     graph = build_graph(spaces=spaces, config=config)
 
-    # Ensure clustering is computed
+    # build_graph clusters the edges it just built; only run a separate
+    # pass when clustering is disabled in config
     if graph.stats.cluster_count == 0:
         print("Computing clusters...")
-        cluster_count = compute_clusters(graph.nodes, graph.edges)
+        cluster_count = compute_clusters(graph.nodes, graph.edges_resolved)
         graph.stats.cluster_count = cluster_count
     else:
         print(f"Using existing {graph.stats.cluster_count} clusters")
@@ -251,77 +302,59 @@ def detect_gaps(spaces: list[str], min_gap_score: float = 0.3) -> GapsResult:
 
     print(f"Analyzing {len(clusters)} clusters")
 
-    # Compute cluster centroids
-    cluster_centroids = {}
-    for cluster_id, members in clusters.items():
-        member_ids = [node.id for node in members]
-        centroid = get_cluster_centroid(member_ids, all_embeddings)
-        cluster_centroids[cluster_id] = centroid
+    # Only clusters of 3+ nodes can form gaps; dropping the many orphan and
+    # singleton clusters first keeps the KxK pair arrays small
+    cluster_ids = sorted(cid for cid, members in clusters.items() if len(members) >= 3)
+
+    # Tag sets per cluster, so shared tags are a single set intersection per pair
+    cluster_tagsets = {cid: get_cluster_tagset(clusters[cid]) for cid in cluster_ids}
+
+    # Compute cluster centroids; clusters without embeddings get a zero
+    # vector of the corpus dimension so all centroids stack into one matrix
+    dim = next((len(embedding) for embedding in all_embeddings.values()), 768)
+    centroids = np.array([
+        get_cluster_centroid([node.id for node in clusters[cid]], all_embeddings, dim)
+        for cid in cluster_ids
+    ]).reshape(len(cluster_ids), dim)
+
+    # Score all cluster pairs at once
+    sizes = np.array([len(clusters[cid]) for cid in cluster_ids])
+    cross_link_matrix = count_cross_link_matrix(cluster_ids, clusters, graph.edges_resolved)
 
-    # Analyze all cluster pairs
     gaps = []
-    cluster_ids = sorted(clusters.keys())
-
-    for i, cluster_a_id in enumerate(cluster_ids):
-        for cluster_b_id in cluster_ids[i+1:]:
-            cluster_a_members = clusters[cluster_a_id]
-            cluster_b_members = clusters[cluster_b_id]
-
-            size_a = len(cluster_a_members)
-            size_b = len(cluster_b_members)
-
-            # Skip if clusters are too small
-            if size_a < 3 or size_b < 3:
-                continue
-
-            # Compute semantic similarity of centroids
-            centroid_a = cluster_centroids[cluster_a_id]
-            centroid_b = cluster_centroids[cluster_b_id]
-
-            # Check if centroids are valid (not all zeros)
-            if np.all(centroid_a == 0) or np.all(centroid_b == 0):
-                continue
-
-            semantic_sim = cosine_similarity(centroid_a, centroid_b)
-
-            # Count cross links
-            cross_links = count_cross_links(cluster_a_members, cluster_b_members, graph.edges)
-
-            # Compute link density (actual / max possible)
-            max_possible_links = size_a * size_b
-            link_density = cross_links / max_possible_links if max_possible_links > 0 else 0.0
-
-            # Compute gap score
-            gap_score = semantic_sim - link_density
-
-            # Filter by threshold
-            if gap_score < min_gap_score:
-                continue
-
-            # Get cluster info
-            cluster_a_info = get_cluster_info(cluster_a_id, cluster_a_members, graph)
-            cluster_b_info = get_cluster_info(cluster_b_id, cluster_b_members, graph)
-
-            # Find shared tags and boundary nodes
-            shared_tags = find_shared_tags(cluster_a_members, cluster_b_members)
-            boundary_nodes = find_boundary_nodes(cluster_a_members, cluster_b_members, graph.edges)
-
-            gap = KnowledgeGap(
-                cluster_a=cluster_a_id,
-                cluster_b=cluster_b_id,
-                semantic_similarity=semantic_sim,
-                link_density=link_density,
-                cross_links=cross_links,
-                gap_score=gap_score,
-                cluster_a_info=cluster_a_info,
-                cluster_b_info=cluster_b_info,
-                shared_tags=shared_tags,
-                boundary_nodes=boundary_nodes
-            )
-            gaps.append(gap)
+    pairs = score_cluster_pairs(centroids, cross_link_matrix, sizes, min_gap_score)
+
+    # Build full gap details only for pairs above threshold
+    for i, j, semantic_sim, link_density, gap_score in pairs:
+        cluster_a_id = cluster_ids[i]
+        cluster_b_id = cluster_ids[j]
+        cluster_a_members = clusters[cluster_a_id]
+        cluster_b_members = clusters[cluster_b_id]
+
+        # Get cluster info
+        cluster_a_info = get_cluster_info(cluster_a_id, cluster_a_members, graph)
+        cluster_b_info = get_cluster_info(cluster_b_id, cluster_b_members, graph)
+
+        # Find shared tags and boundary nodes
+        shared_tags = find_shared_tags(cluster_tagsets[cluster_a_id], cluster_tagsets[cluster_b_id])
+        boundary_nodes = find_boundary_nodes(cluster_a_members, cluster_b_members, graph.edges_resolved)
+
+        gap = KnowledgeGap(
+            cluster_a=cluster_a_id,
+            cluster_b=cluster_b_id,
+            semantic_similarity=semantic_sim,
+            link_density=link_density,
+            cross_links=int(cross_link_matrix[i, j]),
+            gap_score=gap_score,
+            cluster_a_info=cluster_a_info,
+            cluster_b_info=cluster_b_info,
+            shared_tags=shared_tags,
+            boundary_nodes=boundary_nodes
+        )
+        gaps.append(gap)
 
     # Sort by gap score descending
-    gaps.sort(key=lambda g: -g.gap_score)
+    gaps.sort(key=attrgetter('gap_score'), reverse=True)
 
     print(f"Found {len(gaps)} knowledge gaps above threshold {min_gap_score}")
 
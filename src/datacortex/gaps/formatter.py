@@ -1,6 +1,34 @@
 """Format gap detection results as compact TSV/markdown."""
 
-from .detector import GapsResult
+from .detector import ClusterInfo, GapsResult
+
+
+def format_cluster_block(cluster_id: int, info: ClusterInfo) -> list[str]:
+    """Format the CLUSTER section (size, hubs, tags) for one cluster.
+
+    Args:
+        cluster_id: Cluster identifier
+        info: ClusterInfo for the cluster
+
+    Returns:
+        List of output lines, including the trailing blank line
+    """
+    lines = [f"### CLUSTER_{cluster_id} size={info.size}"]
+
+    if info.hub_docs:
+        hubs_str = ", ".join(info.hub_docs[:5])
+        lines.append(f"HUBS: {hubs_str}")
+    else:
+        lines.append("HUBS: (none)")
+
+    if info.top_tags:
+        tags_str = ", ".join([f"{tag}({count})" for tag, count in info.top_tags])
+        lines.append(f"TAGS: {tags_str}")
+    else:
+        lines.append("TAGS: (none)")
+
+    lines.append("")
+    return lines
 
 
 def format_gaps(result: GapsResult) -> str:
@@ -43,6 +71,9 @@ def format_gaps(result: GapsResult) -> str:
         lines.append("")
         return "\n".join(lines)
 
+    # Rendered cluster blocks keyed by cluster_id
+    cluster_blocks: dict[int, list[str]] = {}
+
     # Format each gap
     for rank, gap in enumerate(result.gaps, start=1):
         lines.append(f"## GAP rank={rank} gap_score={gap.gap_score:.2f}")
@@ -52,39 +83,11 @@ def format_gaps(result: GapsResult) -> str:
         lines.append(f"cross_links: {gap.cross_links}")
         lines.append("")
 
-        # Cluster A info
-        lines.append(f"### CLUSTER_{gap.cluster_a} size={gap.cluster_a_info.size}")
-
-        if gap.cluster_a_info.hub_docs:
-            hubs_str = ", ".join(gap.cluster_a_info.hub_docs[:5])
-            lines.append(f"HUBS: {hubs_str}")
-        else:
-            lines.append("HUBS: (none)")
-
-        if gap.cluster_a_info.top_tags:
-            tags_str = ", ".join([f"{tag}({count})" for tag, count in gap.cluster_a_info.top_tags])
-            lines.append(f"TAGS: {tags_str}")
-        else:
-            lines.append("TAGS: (none)")
-
-        lines.append("")
-
-        # Cluster B info
-        lines.append(f"### CLUSTER_{gap.cluster_b} size={gap.cluster_b_info.size}")
-
-        if gap.cluster_b_info.hub_docs:
-            hubs_str = ", ".join(gap.cluster_b_info.hub_docs[:5])
-            lines.append(f"HUBS: {hubs_str}")
-        else:
-            lines.append("HUBS: (none)")
-
-        if gap.cluster_b_info.top_tags:
-            tags_str = ", ".join([f"{tag}({count})" for tag, count in gap.cluster_b_info.top_tags])
-            lines.append(f"TAGS: {tags_str}")
-        else:
-            lines.append("TAGS: (none)")
-
-        lines.append("")
+        # Cluster info blocks (hub clusters recur across many gaps)
+        for cluster_id, info in ((gap.cluster_a, gap.cluster_a_info), (gap.cluster_b, gap.cluster_b_info)):
+            if cluster_id not in cluster_blocks:
+                cluster_blocks[cluster_id] = format_cluster_block(cluster_id, info)
+            lines.extend(cluster_blocks[cluster_id])
 
         # Shared context
         if gap.shared_tags:
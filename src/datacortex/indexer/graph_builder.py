@@ -1,5 +1,6 @@
 """Build knowledge graph from Datacore database."""
 
+import sys
 from datetime import datetime
 from typing import Optional
 
@@ -7,6 +8,25 @@ from ..core.config import DatacortexConfig
 from ..core.database import get_connection, space_exists
 from ..core.models import Edge, Graph, GraphStats, Node, NodeType
 
+# Queries run against every space database
+_FILES_SQL = """
+    SELECT id, path, space, type, title, word_count,
+           maturity, is_stub, created_at, updated_at
+    FROM files
+"""
+
+_LINKS_SQL = """
+    SELECT source_id, target_id, target_title, syntax, resolved
+    FROM links
+"""
+
+# One row per tag, grouped by file so each file's tags arrive as one run
+_TAGS_SQL = """
+    SELECT file_id, normalized_tag
+    FROM tags
+    ORDER BY file_id
+"""
+
 
 def map_type(db_type: str) -> NodeType:
     """Map database file type to NodeType enum."""
@@ -45,24 +65,23 @@ def build_graph(
     nodes: list[Node] = []
     edges: list[Edge] = []
     seen_node_ids: set[str] = set()
-    tags_map: dict[str, list[str]] = {}
+    tags_map: dict[str, tuple[str, ...]] = {}
 
     for space in spaces:
         if not space_exists(space):
             continue
 
         conn = get_connection(space)
-        cursor = conn.cursor()
 
-        # Fetch all files
-        cursor.execute("""
-            SELECT id, path, space, type, title, word_count,
-                   maturity, is_stub, created_at, updated_at
-            FROM files
-        """)
+        # Read-only ingest
+        conn.execute("PRAGMA query_only=ON")
 
-        for row in cursor.fetchall():
-            if row['id'] in seen_node_ids:
+        # Fetch all files (iterate the cursor rather than materialising fetchall())
+        for row in conn.execute(_FILES_SQL):
+            # Intern ids so later dict/set lookups against edge endpoints
+            # hit the identity fast path
+            file_id = sys.intern(row['id'])
+            if file_id in seen_node_ids:
                 continue
 
             # Filter stubs if configured
@@ -70,10 +89,10 @@ def build_graph(
                 continue
 
             node = Node(
-                id=row['id'],
-                title=row['title'] or row['id'],
+                id=file_id,
+                title=row['title'] or file_id,
                 path=row['path'],
-                space=row['space'],
+                space=sys.intern(row['space']),
                 type=map_type(row['type']),
                 maturity=row['maturity'],
                 is_stub=bool(row['is_stub']),
@@ -82,15 +101,10 @@ def build_graph(
                 updated_at=parse_datetime(row['updated_at']),
             )
             nodes.append(node)
-            seen_node_ids.add(row['id'])
+            seen_node_ids.add(file_id)
 
         # Fetch all links
-        cursor.execute("""
-            SELECT source_id, target_id, target_title, syntax, resolved
-            FROM links
-        """)
-
-        for row in cursor.fetchall():
+        for row in conn.execute(_LINKS_SQL):
             source_id = row['source_id']
             target_id = row['target_id'] or row['target_title']
             resolved = bool(row['resolved'])
@@ -105,43 +119,46 @@ def build_graph(
 
             edge = Edge(
                 id=f"{source_id}->{target_id}",
-                source=source_id,
-                target=target_id,
+                source=sys.intern(source_id),
+                target=sys.intern(target_id),
                 syntax=row['syntax'] or 'wiki-link',
                 resolved=resolved,
             )
             edges.append(edge)
 
-        # Fetch tags
-        cursor.execute("""
-            SELECT file_id, GROUP_CONCAT(normalized_tag, ',') as tags
-            FROM tags
-            GROUP BY file_id
-        """)
-
-        for row in cursor.fetchall():
-            if row['tags']:
-                tags_map[row['file_id']] = [t for t in row['tags'].split(',') if t]
+        # Fetch tags; a file's tags in a later space replace earlier ones
+        space_tags: dict[str, list[str]] = {}
+        current_id = None
+        for file_id, tag in conn.execute(_TAGS_SQL):
+            if tag:
+                if file_id != current_id:
+                    current_tags = space_tags.setdefault(file_id, [])
+                    current_id = file_id
+                current_tags.append(tag)
+        tags_map.update((file_id, tuple(tags)) for file_id, tags in space_tags.items())
 
         conn.close()
 
     # Attach tags to nodes
     for node in nodes:
-        node.tags = tags_map.get(node.id, [])
+        node.tags = tags_map.get(node.id, ())
 
     # Compute degrees
     compute_degrees(nodes, edges)
 
+    # Centrality and clustering only look at resolved edges
+    resolved_edges = [e for e in edges if e.resolved]
+
     # Compute centrality if configured
     if config.graph.compute_centrality:
         from ..metrics.centrality import compute_pagerank
-        compute_pagerank(nodes, edges)
+        compute_pagerank(nodes, resolved_edges)
 
     # Compute clusters if configured
     cluster_count = 0
     if config.graph.compute_clusters:
         from ..metrics.clusters import compute_clusters
-        cluster_count = compute_clusters(nodes, edges)
+        cluster_count = compute_clusters(nodes, resolved_edges)
 
     # Filter by min_degree if configured
     if config.graph.min_degree > 0:
@@ -1,17 +1,40 @@
 """Cluster analysis logic for knowledge insights."""
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 
 import networkx as nx
+import numpy as np
 
-from ..core.database import get_connection, space_exists
+from ..core.database import get_connection, get_db_version, space_exists
+from ..core.models import Graph
 from ..indexer.graph_builder import build_graph
+from ..metrics._kernels import (
+    build_edge_arrays,
+    build_node_arrays,
+    build_tag_arrays,
+    count_internal_edges,
+    cross_cluster_links,
+    external_link_clusters,
+    internal_edge_counts,
+    top_counts,
+    top_tags_by_cluster,
+)
 from ..metrics.clusters import compute_clusters
 
 
+_CONTENT_SQL = "SELECT content FROM files WHERE id = ?"
+
+# Threads used to load content samples in analyze_clusters
+SAMPLE_WORKERS = 4
+
+
 @dataclass
 class ClusterAnalysis:
     """Detailed analysis of a single cluster."""
@@ -33,6 +56,18 @@ class InsightsResult:
     generated_at: str
 
 
+@dataclass
+class ClusterAggregates:
+    """Per-cluster totals gathered in one pass over nodes and edges."""
+    sizes: dict[int, int]
+    word_sums: dict[int, int]
+    centrality_sums: dict[int, float]
+    centrality_counts: dict[int, int]
+    tag_freqs: dict[int, list[tuple[str, int]]]  # top 10 (tag, count)
+    internal_edges: dict[int, int]
+    cross_links: dict[int, Counter]  # cluster_id -> Counter of other cluster_id
+
+
 def load_document_content(conn, file_id: str) -> str:
     """Load full content from files table.
 
@@ -43,20 +78,48 @@ def load_document_content(conn, file_id: str) -> str:
     Returns:
         Content string or empty string if not found
     """
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT content FROM files WHERE id = ?
-    """, (file_id,))
-    row = cursor.fetchone()
-    return row['content'] if row else ""
+    row = conn.execute(_CONTENT_SQL, (file_id,)).fetchone()
+    return row[0] if row else ""
+
+
+def load_documents_content(conn, file_ids: list[str]) -> dict[str, str]:
+    """Load full content for several files with a single query.
+
+    Args:
+        conn: Database connection
+        file_ids: File IDs to load
+
+    Returns:
+        Dict mapping file_id to content (files not found are omitted)
+    """
+    if not file_ids:
+        return {}
 
+    placeholders = ','.join('?' * len(file_ids))
+    cursor = conn.execute(f"""
+        SELECT id, content FROM files WHERE id IN ({placeholders})
+    """, file_ids)
 
-def get_cluster_stats(members: list, edges: list) -> dict:
+    return {row['id']: row['content'] or "" for row in cursor}
+
+
+def get_cluster_stats(
+    members: list,
+    edges: list,
+    node_arrays: Optional[dict] = None,
+    member_mask: Optional[np.ndarray] = None,
+    edge_arrays: Optional[tuple] = None
+) -> dict:
     """Compute statistics for a cluster.
 
     Args:
         members: List of Node objects in cluster
         edges: List of Edge objects for computing density
+        node_arrays: Optional Graph.node_arrays for the whole graph
+        member_mask: Bool array selecting members in node_arrays; word and
+            centrality totals are read from the arrays when both are given
+        edge_arrays: Optional Graph.edge_arrays; with member_mask, internal
+            edges are counted on the arrays instead of edges
 
     Returns:
         Dict with avg_words, total_words, avg_centrality, density
@@ -69,21 +132,45 @@ def get_cluster_stats(members: list, edges: list) -> dict:
             'density': 0.0
         }
 
-    total_words = sum(node.word_count for node in members)
-    avg_words = total_words / len(members)
-
-    centralities = [node.centrality for node in members if node.centrality is not None]
-    avg_centrality = sum(centralities) / len(centralities) if centralities else 0.0
+    if node_arrays is not None and member_mask is not None:
+        total_words = int(node_arrays['word_count'][member_mask].sum())
+        centrality_sum = float(node_arrays['centrality'][member_mask].sum())
+        centrality_count = int(np.count_nonzero(member_mask))
+    else:
+        total_words = sum(node.word_count for node in members)
+        centralities = [node.centrality for node in members if node.centrality is not None]
+        centrality_sum = sum(centralities)
+        centrality_count = len(centralities)
 
     # Compute density: actual edges / max possible edges
-    member_ids = {node.id for node in members}
-    internal_edges = 0
+    if edge_arrays is not None and member_mask is not None:
+        _, src, tgt, resolved = edge_arrays
+        internal_edges = count_internal_edges(src, tgt, resolved, member_mask.view(np.int8), 1)
+    else:
+        member_ids = {node.id for node in members}
+        internal_edges = 0
+
+        for edge in edges:
+            if edge.resolved and edge.source in member_ids and edge.target in member_ids:
+                internal_edges += 1
+
+    return _format_cluster_stats(
+        len(members), total_words, centrality_sum, centrality_count, internal_edges
+    )
 
-    for edge in edges:
-        if edge.resolved and edge.source in member_ids and edge.target in member_ids:
-            internal_edges += 1
 
-    max_edges = (len(members) * (len(members) - 1)) / 2 if len(members) > 1 else 0
+def _format_cluster_stats(
+    size: int,
+    total_words: int,
+    centrality_sum: float,
+    centrality_count: int,
+    internal_edges: int
+) -> dict:
+    """Turn raw cluster totals into the stats dict used by ClusterAnalysis."""
+    avg_words = total_words / size
+    avg_centrality = centrality_sum / centrality_count if centrality_count else 0.0
+
+    max_edges = (size * (size - 1)) / 2 if size > 1 else 0
     density = internal_edges / max_edges if max_edges > 0 else 0.0
 
     return {
@@ -94,6 +181,85 @@ def get_cluster_stats(members: list, edges: list) -> dict:
     }
 
 
+def _compute_all_cluster_aggregates(
+    nodes: list,
+    resolved_edges: list,
+    node_to_cluster: dict,
+    node_arrays: Optional[dict] = None,
+    tag_arrays: Optional[tuple] = None
+) -> ClusterAggregates:
+    """Compute per-cluster totals for every cluster at once.
+
+    Sizes and word/centrality sums are bincounts over node arrays, tag counts
+    are grouped over the flattened tag arrays, and array kernels over
+    resolved edges split them into internal edges and cross-cluster link
+    counts.
+
+    Args:
+        nodes: List of all Node objects
+        resolved_edges: List of resolved Edge objects
+        node_to_cluster: Dict mapping node ID to cluster ID
+        node_arrays: Node arrays aligned with nodes (built if not given)
+        tag_arrays: Tag arrays aligned with nodes (built if not given)
+
+    Returns:
+        ClusterAggregates keyed by cluster_id
+    """
+    if node_arrays is None:
+        node_arrays = build_node_arrays(nodes)
+    if tag_arrays is None:
+        tag_arrays = build_tag_arrays(nodes)
+
+    cluster_ids = sorted(set(node_to_cluster[node.id] for node in nodes))
+    cluster_index = {cid: i for i, cid in enumerate(cluster_ids)}
+    cluster_of = np.fromiter(
+        (cluster_index[node_to_cluster[node.id]] for node in nodes), dtype=np.int32, count=len(nodes)
+    )
+    n_clusters = len(cluster_ids)
+
+    # bincount accumulates in node order, matching a sequential sum
+    size_counts = np.bincount(cluster_of, minlength=n_clusters)
+    word_totals = np.bincount(cluster_of, weights=node_arrays['word_count'], minlength=n_clusters)
+    centrality_totals = np.bincount(cluster_of, weights=node_arrays['centrality'], minlength=n_clusters)
+
+    sizes = {cid: int(size_counts[i]) for i, cid in enumerate(cluster_ids)}
+    word_sums = {cid: int(word_totals[i]) for i, cid in enumerate(cluster_ids)}
+    centrality_sums = {cid: float(centrality_totals[i]) for i, cid in enumerate(cluster_ids)}
+    centrality_counts = dict(sizes)
+
+    vocab, tag_idx, tag_offsets = tag_arrays
+    top_tags = top_tags_by_cluster(tag_idx, tag_offsets, cluster_of, n_clusters, len(vocab), 10)
+    tag_freqs = {
+        cid: [(vocab[t], c) for t, c in zip(top_tags[i][0].tolist(), top_tags[i][1].tolist())]
+        for i, cid in enumerate(cluster_ids)
+    }
+
+    # Edge pass runs on node-position arrays
+    _, src, tgt, resolved = build_edge_arrays(nodes, resolved_edges)
+
+    internal_counts = internal_edge_counts(src, tgt, resolved, cluster_of, n_clusters)
+    internal_edges = {cid: int(internal_counts[i]) for i, cid in enumerate(cluster_ids)}
+
+    # Insert pairs in first-edge order so Counter.most_common breaks ties
+    # the same way a sequential edge scan would
+    cross_links = {cid: Counter() for cid in cluster_ids}
+    from_cluster, to_cluster, counts, first_edge = cross_cluster_links(
+        src, tgt, resolved, cluster_of, n_clusters
+    )
+    for i in np.argsort(first_edge, kind='stable').tolist():
+        cross_links[cluster_ids[from_cluster[i]]][cluster_ids[to_cluster[i]]] = int(counts[i])
+
+    return ClusterAggregates(
+        sizes=sizes,
+        word_sums=word_sums,
+        centrality_sums=centrality_sums,
+        centrality_counts=centrality_counts,
+        tag_freqs=tag_freqs,
+        internal_edges=internal_edges,
+        cross_links=cross_links,
+    )
+
+
 def get_hub_documents(members: list, top_n: int = 10) -> list[dict]:
     """Get top documents by centrality with metadata.
 
@@ -104,15 +270,15 @@ def get_hub_documents(members: list, top_n: int = 10) -> list[dict]:
     Returns:
         List of dicts with title, centrality, word_count, tags, path
     """
-    # Sort by centrality (use degree as fallback)
-    sorted_members = sorted(
+    # Top N by centrality (use degree as fallback)
+    top_members = heapq.nlargest(
+        top_n,
         members,
-        key=lambda n: n.centrality if n.centrality is not None else n.degree,
-        reverse=True
+        key=lambda n: n.centrality if n.centrality is not None else n.degree
     )
 
     hubs = []
-    for node in sorted_members[:top_n]:
+    for node in top_members:
         hubs.append({
             'title': node.title,
             'centrality': node.centrality if node.centrality is not None else 0.0,
@@ -124,15 +290,28 @@ def get_hub_documents(members: list, top_n: int = 10) -> list[dict]:
     return hubs
 
 
-def get_tag_frequency(members: list) -> list[tuple[str, int]]:
+def get_tag_frequency(
+    members: list,
+    tag_arrays: Optional[tuple] = None,
+    member_mask: Optional[np.ndarray] = None
+) -> list[tuple[str, int]]:
     """Get tag frequency counts across cluster members.
 
     Args:
         members: List of Node objects
+        tag_arrays: Optional Graph.tag_arrays for the whole graph
+        member_mask: Bool array selecting members in tag_arrays; counts are
+            computed on the arrays when both are given
 
     Returns:
         List of (tag, count) tuples, sorted by count descending
     """
+    if tag_arrays is not None and member_mask is not None:
+        vocab, tag_idx, offsets = tag_arrays
+        member_tags = tag_idx[np.repeat(member_mask, np.diff(offsets))]
+        tag_ids, counts = top_counts(member_tags, 10)
+        return [(vocab[t], c) for t, c in zip(tag_ids.tolist(), counts.tolist())]
+
     tag_counter = Counter()
 
     for node in members:
@@ -143,20 +322,17 @@ def get_tag_frequency(members: list) -> list[tuple[str, int]]:
     return tag_counter.most_common(10)
 
 
-def get_cluster_connections(cluster_id: int, all_clusters: dict, edges: list) -> list[dict]:
+def get_cluster_connections(cluster_id: int, node_to_cluster: dict, edges: list) -> list[dict]:
     """Get connections from this cluster to other clusters.
 
     Args:
         cluster_id: Current cluster ID
-        all_clusters: Dict mapping cluster_id to list of Node objects
+        node_to_cluster: Dict mapping node ID to cluster ID
         edges: List of Edge objects
 
     Returns:
         List of dicts with cluster_id and link_count, sorted by count descending
     """
-    # Get member IDs for current cluster
-    current_members = {node.id for node in all_clusters[cluster_id]}
-
     # Count links to each other cluster
     connections = Counter()
 
@@ -164,28 +340,16 @@ def get_cluster_connections(cluster_id: int, all_clusters: dict, edges: list) ->
         if not edge.resolved:
             continue
 
-        source_in_current = edge.source in current_members
-        target_in_current = edge.target in current_members
-
-        # Skip internal edges
-        if source_in_current and target_in_current:
-            continue
+        source_cluster = node_to_cluster.get(edge.source)
+        target_cluster = node_to_cluster.get(edge.target)
 
-        # Find which cluster the other end is in
-        other_node_id = None
-        if source_in_current:
-            other_node_id = edge.target
-        elif target_in_current:
-            other_node_id = edge.source
-
-        if other_node_id:
-            # Find which cluster this node belongs to
-            for other_cluster_id, other_members in all_clusters.items():
-                if other_cluster_id == cluster_id:
-                    continue
-                if any(node.id == other_node_id for node in other_members):
-                    connections[other_cluster_id] += 1
-                    break
+        # Count edges with exactly one end in the current cluster
+        if source_cluster == cluster_id:
+            if target_cluster is not None and target_cluster != cluster_id:
+                connections[target_cluster] += 1
+        elif target_cluster == cluster_id:
+            if source_cluster is not None:
+                connections[source_cluster] += 1
 
     # Return sorted list
     result = [
@@ -196,6 +360,30 @@ def get_cluster_connections(cluster_id: int, all_clusters: dict, edges: list) ->
     return result
 
 
+def get_cluster_connections_from_arrays(
+    cluster_id: int,
+    edge_arrays: tuple,
+    cluster_of: np.ndarray
+) -> list[dict]:
+    """get_cluster_connections on node-position arrays.
+
+    Args:
+        cluster_id: Current cluster ID
+        edge_arrays: Graph.edge_arrays for the whole graph
+        cluster_of: Cluster ID per node position (-1 if unclustered)
+
+    Returns:
+        List of dicts with cluster_id and link_count, sorted by count descending
+    """
+    _, src, tgt, resolved = edge_arrays
+    others = external_link_clusters(src, tgt, resolved, cluster_of, cluster_id)
+    other_ids, counts = top_counts(others, 10)
+    return [
+        {'cluster_id': cid, 'link_count': count}
+        for cid, count in zip(other_ids.tolist(), counts.tolist())
+    ]
+
+
 def get_content_samples(members: list, conn, top_n: int = 5, excerpt_len: int = 500) -> list[dict]:
     """Load content excerpts for top documents.
 
@@ -208,33 +396,40 @@ def get_content_samples(members: list, conn, top_n: int = 5, excerpt_len: int =
     Returns:
         List of dicts with title, word_count, excerpt
     """
-    # Sort by centrality (use word_count as secondary sort)
-    sorted_members = sorted(
+    # Top N by centrality (use word_count as secondary sort)
+    top_members = heapq.nlargest(
+        top_n,
         members,
         key=lambda n: (
             n.centrality if n.centrality is not None else 0,
             n.word_count
-        ),
-        reverse=True
+        )
     )
 
+    # Load content for all samples in one query
+    content_map = load_documents_content(conn, [node.id for node in top_members])
+
+    # Sentence/word breaks are only used past 70% of excerpt_len, so the
+    # boundary search starts there instead of scanning the whole excerpt
+    break_from = int(excerpt_len * 0.7) + 1
+
     samples = []
-    for node in sorted_members[:top_n]:
-        # Load content
-        content = load_document_content(conn, node.id)
+    for node in top_members:
+        content = content_map.get(node.id, "")
 
         # Extract excerpt (first excerpt_len chars, clean up)
         excerpt = content[:excerpt_len].strip()
         if len(content) > excerpt_len:
             # Try to break at sentence or word boundary
-            last_period = excerpt.rfind('.')
-            last_space = excerpt.rfind(' ')
-            if last_period > excerpt_len * 0.7:
+            last_period = excerpt.rfind('.', break_from)
+            if last_period != -1:
                 excerpt = excerpt[:last_period + 1]
-            elif last_space > excerpt_len * 0.7:
-                excerpt = excerpt[:last_space] + '...'
             else:
-                excerpt = excerpt + '...'
+                last_space = excerpt.rfind(' ', break_from)
+                if last_space != -1:
+                    excerpt = excerpt[:last_space] + '...'
+                else:
+                    excerpt = excerpt + '...'
 
         samples.append({
             'title': node.title,
@@ -245,47 +440,141 @@ def get_content_samples(members: list, conn, top_n: int = 5, excerpt_len: int =
     return samples
 
 
-def analyze_single_cluster(cluster_id: int, spaces: list[str]) -> ClusterAnalysis:
-    """Detailed analysis for one cluster.
+def _load_samples_concurrently(
+    members_by_cluster: dict[int, list],
+    space: str,
+    max_workers: int = SAMPLE_WORKERS
+) -> dict[int, list[dict]]:
+    """Load content samples for several clusters on a thread pool.
+
+    sqlite3 releases the GIL while a query runs, so cluster queries overlap.
+    Clusters are split into one batch per worker and each batch uses its own
+    connection, since sqlite3 connections cannot be shared between threads.
 
     Args:
-        cluster_id: Cluster ID to analyze
-        spaces: List of space names
+        members_by_cluster: Dict mapping cluster ID to its member nodes
+        space: Space whose database holds the content
+        max_workers: Thread pool size
 
     Returns:
-        ClusterAnalysis with full details
+        Dict mapping cluster ID to get_content_samples output
     """
-    from ..core.config import load_config
-    config = load_config()
+    cluster_ids = list(members_by_cluster)
+    batches = [cluster_ids[i::max_workers] for i in range(max_workers) if cluster_ids[i::max_workers]]
+
+    def load_batch(batch: list[int]) -> dict[int, list[dict]]:
+        conn = get_connection(space)
+        try:
+            return {cid: get_content_samples(members_by_cluster[cid], conn, top_n=5) for cid in batch}
+        finally:
+            conn.close()
+
+    samples = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch_samples in executor.map(load_batch, batches):
+            samples.update(batch_samples)
+    return samples
 
-    # Build graph
-    graph = build_graph(spaces=spaces, config=config)
 
-    # Ensure clustering is computed
-    if graph.stats.cluster_count == 0:
-        compute_clusters(graph.nodes, graph.edges)
-
-    # Group by cluster
+def _group_by_cluster(nodes: list) -> dict[int, list]:
+    """Group nodes by cluster ID (unclustered nodes go to cluster 0)."""
     clusters = {}
-    for node in graph.nodes:
+    for node in nodes:
         cid = node.cluster_id if node.cluster_id is not None else 0
         if cid not in clusters:
             clusters[cid] = []
         clusters[cid].append(node)
+    return clusters
+
+
+@lru_cache(maxsize=4)
+def _build_graph_cached(spaces: tuple[str, ...], config_key: str, versions: tuple):
+    """Build and cluster a graph once per (spaces, config, database versions).
+
+    Args:
+        spaces: Tuple of space names
+        config_key: JSON dump of the DatacortexConfig used for the build
+        versions: get_db_version() of each space, so re-indexing rebuilds
+
+    Returns:
+        Graph with cluster IDs assigned (shared between callers; do not mutate)
+    """
+    from ..core.config import DatacortexConfig
+    config = DatacortexConfig.model_validate_json(config_key)
+
+    graph = build_graph(spaces=list(spaces), config=config)
+
+    # Ensure clustering is computed
+    if graph.stats.cluster_count == 0:
+        graph.stats.cluster_count = compute_clusters(graph.nodes, graph.edges_resolved)
+
+    return graph
+
+
+def analyze_single_cluster(
+    cluster_id: int,
+    spaces: list[str],
+    graph: Optional[Graph] = None,
+    clusters: Optional[dict[int, list]] = None,
+    conn=None
+) -> ClusterAnalysis:
+    """Detailed analysis for one cluster.
 
-    if cluster_id not in clusters:
+    Callers analyzing several clusters can pass the same graph, clusters and
+    conn to skip rebuilding them. Without a graph, the built and clustered
+    graph is cached per (spaces, config) until a space database changes.
+
+    Args:
+        cluster_id: Cluster ID to analyze
+        spaces: List of space names
+        graph: Prebuilt graph with clusters computed (default: build from spaces)
+        clusters: Nodes grouped by cluster ID for graph (default: read node.cluster_id)
+        conn: Database connection for content loading (default: first space)
+
+    Returns:
+        ClusterAnalysis with full details
+    """
+    if graph is None:
+        from ..core.config import load_config
+        config = load_config()
+        graph = _build_graph_cached(
+            tuple(spaces), config.model_dump_json(), tuple(get_db_version(space) for space in spaces)
+        )
+
+    # Cluster ID per node position; only the requested cluster's members are
+    # collected. With an explicit clusters dict, nodes missing from it get -1
+    # (in no cluster). Otherwise node.cluster_id is used and None maps to
+    # cluster 0, as _group_by_cluster does, so unclustered nodes count as
+    # members of cluster 0
+    if clusters is not None:
+        node_to_cluster = {node.id: cid for cid, cluster_members in clusters.items() for node in cluster_members}
+        cluster_of = np.fromiter(
+            (node_to_cluster.get(node.id, -1) for node in graph.nodes), dtype=np.int64, count=len(graph.nodes)
+        )
+        members = clusters.get(cluster_id, [])
+    else:
+        cluster_of = np.fromiter(
+            (node.cluster_id if node.cluster_id is not None else 0 for node in graph.nodes),
+            dtype=np.int64, count=len(graph.nodes)
+        )
+        members = [node for node, cid in zip(graph.nodes, cluster_of.tolist()) if cid == cluster_id]
+
+    if not members:
         raise ValueError(f"Cluster {cluster_id} not found")
 
-    members = clusters[cluster_id]
+    member_mask = cluster_of == cluster_id
 
     # Get database connection for content loading
-    conn = get_connection(spaces[0]) if spaces else get_connection('personal')
+    if conn is None:
+        conn = get_connection(spaces[0]) if spaces else get_connection('personal')
 
-    # Compute analysis
-    stats = get_cluster_stats(members, graph.edges)
+    # Compute analysis on node-position arrays
+    stats = get_cluster_stats(
+        members, graph.edges_resolved, graph.node_arrays, member_mask, graph.edge_arrays
+    )
     hubs = get_hub_documents(members, top_n=10)
-    tag_freq = get_tag_frequency(members)
-    connections = get_cluster_connections(cluster_id, clusters, graph.edges)
+    tag_freq = get_tag_frequency(members, graph.tag_arrays, member_mask)
+    connections = get_cluster_connections_from_arrays(cluster_id, graph.edge_arrays, cluster_of)
     samples = get_content_samples(members, conn, top_n=5)
 
     return ClusterAnalysis(
@@ -310,13 +599,15 @@ def analyze_clusters(spaces: list[str]) -> InsightsResult:
 
     Algorithm:
         1. Build graph and compute Louvain clusters
-        2. For each cluster:
+        2. Aggregate stats, tag counts and cross-cluster links for all
+           clusters in one pass over nodes and edges
+        3. For each cluster:
            - Compute stats (avg words, density, centrality)
            - Get hub documents (top 10 by centrality)
            - Get tag frequency (top 10 tags)
            - Get connections to other clusters
            - Sample content (top 5 docs, first 500 chars)
-        3. Return sorted by cluster size descending
+        4. Return sorted by cluster size descending
     """
     print(f"Building graph from spaces: {', '.join(spaces)}")
 
@@ -329,50 +620,58 @@ def analyze_clusters(spaces: list[str]) -> InsightsResult:
     # Ensure clustering is computed
     if graph.stats.cluster_count == 0:
         print("Computing clusters...")
-        cluster_count = compute_clusters(graph.nodes, graph.edges)
+        cluster_count = compute_clusters(graph.nodes, graph.edges_resolved)
         graph.stats.cluster_count = cluster_count
     else:
         print(f"Using existing {graph.stats.cluster_count} clusters")
 
     # Group nodes by cluster
-    clusters = {}
-    for node in graph.nodes:
-        cluster_id = node.cluster_id if node.cluster_id is not None else 0
-        if cluster_id not in clusters:
-            clusters[cluster_id] = []
-        clusters[cluster_id].append(node)
+    clusters = _group_by_cluster(graph.nodes)
 
     print(f"Analyzing {len(clusters)} clusters")
 
-    # Get database connection for content loading
-    # Use first available space
-    conn = None
-    for space in spaces:
-        if space_exists(space):
-            conn = get_connection(space)
-            break
+    # Shared lookups for every cluster: node -> cluster map and resolved edges only
+    node_to_cluster = {node.id: cid for cid, members in clusters.items() for node in members}
+    resolved_edges = graph.edges_resolved
 
-    if conn is None:
-        # Fallback
-        conn = get_connection('personal')
+    # Stats, tag counts and connections for all clusters in one pass
+    aggregates = _compute_all_cluster_aggregates(
+        graph.nodes, resolved_edges, node_to_cluster, graph.node_arrays, graph.tag_arrays
+    )
+
+    # Content is loaded from the first available space
+    content_space = next((space for space in spaces if space_exists(space)), 'personal')
+
+    # Skip very small clusters
+    analyzed_ids = [cid for cid in sorted(clusters.keys()) if len(clusters[cid]) >= 3]
+
+    # Content samples are I/O-bound, so load them for all clusters concurrently
+    samples_by_cluster = _load_samples_concurrently(
+        {cid: clusters[cid] for cid in analyzed_ids}, content_space
+    )
 
     # Analyze each cluster
     cluster_analyses = []
 
-    for cluster_id in sorted(clusters.keys()):
+    for cluster_id in analyzed_ids:
         members = clusters[cluster_id]
 
-        # Skip very small clusters
-        if len(members) < 3:
-            continue
-
         print(f"  Cluster {cluster_id}: {len(members)} nodes")
 
-        stats = get_cluster_stats(members, graph.edges)
+        stats = _format_cluster_stats(
+            aggregates.sizes[cluster_id],
+            aggregates.word_sums[cluster_id],
+            aggregates.centrality_sums[cluster_id],
+            aggregates.centrality_counts[cluster_id],
+            aggregates.internal_edges[cluster_id],
+        )
         hubs = get_hub_documents(members, top_n=10)
-        tag_freq = get_tag_frequency(members)
-        connections = get_cluster_connections(cluster_id, clusters, graph.edges)
-        samples = get_content_samples(members, conn, top_n=5)
+        tag_freq = aggregates.tag_freqs[cluster_id]
+        connections = [
+            {'cluster_id': cid, 'link_count': count}
+            for cid, count in aggregates.cross_links[cluster_id].most_common(10)
+        ]
+        samples = samples_by_cluster[cluster_id]
 
         analysis = ClusterAnalysis(
             cluster_id=cluster_id,
@@ -387,7 +686,7 @@ def analyze_clusters(spaces: list[str]) -> InsightsResult:
         cluster_analyses.append(analysis)
 
     # Sort by size descending
-    cluster_analyses.sort(key=lambda c: -c.size)
+    cluster_analyses.sort(key=attrgetter('size'), reverse=True)
 
     print(f"Completed analysis of {len(cluster_analyses)} clusters")
 
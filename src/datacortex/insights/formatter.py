@@ -1,8 +1,19 @@
 """Format insights to compact TSV/markdown."""
 
+import io
+from typing import BinaryIO
+
 from .analyzer import InsightsResult, ClusterAnalysis
 
 
+# Section headings, encoded once
+_STATS_HEADING = b"### STATS\n"
+_HUBS_HEADING = b"### HUBS\n"
+_TAGS_HEADING = b"### TAGS\n"
+_CONNECTIONS_HEADING = b"### CONNECTIONS\n"
+_SAMPLES_HEADING = b"### SAMPLES\n"
+
+
 def format_insights(result: InsightsResult, include_samples: bool = True) -> str:
     """Format cluster insights to compact TSV/markdown.
 
@@ -13,54 +24,72 @@ def format_insights(result: InsightsResult, include_samples: bool = True) -> str
     Returns:
         Formatted string with cluster analysis
     """
-    lines = []
+    buf = io.BytesIO()
+    format_insights_stream(result, buf, include_samples=include_samples)
+
+    # The stream output is newline-terminated; drop the final newline so the
+    # string matches a '\n'.join() of the lines
+    return buf.getvalue()[:-1].decode('utf-8')
+
+
+def format_insights_stream(result: InsightsResult, stream: BinaryIO, include_samples: bool = True) -> None:
+    """Write cluster insights as UTF-8 TSV/markdown to a binary stream.
+
+    Args:
+        result: InsightsResult from analyzer
+        stream: Binary file-like object to write to
+        include_samples: Whether to include content samples
+    """
+    write = stream.write
 
     # Header
-    lines.append(f"# CLUSTER_INSIGHTS clusters={result.total_clusters} total_docs={result.total_docs} generated={result.generated_at}")
-    lines.append("")
+    write(f"# CLUSTER_INSIGHTS clusters={result.total_clusters} total_docs={result.total_docs} generated={result.generated_at}\n\n".encode())
 
     # Each cluster
     for cluster in result.clusters:
-        lines.append(f"## CLUSTER id={cluster.cluster_id} size={cluster.size}")
-        lines.append("")
-
-        # Stats
-        lines.append("### STATS")
-        lines.append(f"avg_words: {cluster.stats['avg_words']}")
-        lines.append(f"total_words: {cluster.stats['total_words']}")
-        lines.append(f"avg_centrality: {cluster.stats['avg_centrality']}")
-        lines.append(f"density: {cluster.stats['density']}")
-        lines.append("")
+        stats = cluster.stats
+
+        # Heading and stats
+        write(f"## CLUSTER id={cluster.cluster_id} size={cluster.size}\n\n".encode())
+        write(_STATS_HEADING)
+        write((
+            f"avg_words: {stats['avg_words']}\n"
+            f"total_words: {stats['total_words']}\n"
+            f"avg_centrality: {stats['avg_centrality']}\n"
+            f"density: {stats['density']}\n"
+            "\n"
+        ).encode())
 
         # Hubs
-        lines.append("### HUBS")
-        for hub in cluster.hubs:
-            tags = ','.join(hub['tags'][:3]) if hub['tags'] else 'none'
-            lines.append(f"{hub['title']} | {hub['centrality']:.3f} | {hub['word_count']}w | {tags}")
-        lines.append("")
+        write(_HUBS_HEADING)
+        write("".join(
+            f"{hub['title']} | {hub['centrality']:.3f} | {hub['word_count']}w | "
+            f"{','.join(hub['tags'][:3]) or 'none'}\n"
+            for hub in cluster.hubs
+        ).encode())
+        write(b"\n")
 
         # Tags
-        lines.append("### TAGS")
-        for tag, count in cluster.tag_freq:
-            lines.append(f"{tag}: {count}")
-        lines.append("")
+        write(_TAGS_HEADING)
+        write("".join(f"{tag}: {count}\n" for tag, count in cluster.tag_freq).encode())
+        write(b"\n")
 
         # Connections
         if cluster.connections:
-            lines.append("### CONNECTIONS")
-            for conn in cluster.connections:
-                lines.append(f"cluster_{conn['cluster_id']}: {conn['link_count']} links")
-            lines.append("")
+            write(_CONNECTIONS_HEADING)
+            write("".join(
+                f"cluster_{conn['cluster_id']}: {conn['link_count']} links\n"
+                for conn in cluster.connections
+            ).encode())
+            write(b"\n")
 
         # Samples
         if include_samples and cluster.samples:
-            lines.append("### SAMPLES")
-            for sample in cluster.samples:
-                lines.append(f"#### {sample['title']} ({sample['word_count']}w)")
-                lines.append(sample['excerpt'])
-                lines.append("")
-
-    return '\n'.join(lines)
+            write(_SAMPLES_HEADING)
+            write("".join(
+                f"#### {sample['title']} ({sample['word_count']}w)\n{sample['excerpt']}\n\n"
+                for sample in cluster.samples
+            ).encode())
 
 
 def format_cluster_summary(result: InsightsResult) -> str:
@@ -0,0 +1,259 @@
+"""Array kernels for node- and edge-level graph metrics.
+
+Nodes and edges are represented as parallel NumPy arrays indexed by node
+position so the hot per-node and per-edge loops run inside NumPy instead
+of the interpreter.
+"""
+
+import numpy as np
+
+from ..core.models import Edge, Node
+
+
+def build_node_arrays(nodes: list[Node]) -> dict[str, np.ndarray]:
+    """Convert numeric node fields to arrays aligned with nodes.
+
+    Args:
+        nodes: List of nodes (defines positions)
+
+    Returns:
+        Dict with 'word_count' (int64), 'centrality' (float64) and
+        'degree' (int64) arrays
+    """
+    n = len(nodes)
+    return {
+        'word_count': np.fromiter((node.word_count for node in nodes), dtype=np.int64, count=n),
+        'centrality': np.fromiter((node.centrality for node in nodes), dtype=np.float64, count=n),
+        'degree': np.fromiter((node.degree for node in nodes), dtype=np.int64, count=n),
+    }
+
+
+def build_tag_arrays(nodes: list[Node]) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Flatten node tags into integer ids with CSR-style offsets.
+
+    Args:
+        nodes: List of nodes (defines positions)
+
+    Returns:
+        Tuple of (vocab, tag_idx, offsets)
+        - vocab: tag strings indexed by tag id, in first-seen order
+        - tag_idx: int32 tag id of every tag occurrence, in node order
+        - offsets: int64 array of length len(nodes) + 1; the tags of node i
+          are tag_idx[offsets[i]:offsets[i + 1]]
+    """
+    vocab: dict[str, int] = {}
+    tag_idx = np.fromiter(
+        (vocab.setdefault(tag, len(vocab)) for node in nodes for tag in node.tags), dtype=np.int32
+    )
+    offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter((len(node.tags) for node in nodes), dtype=np.int64, count=len(nodes)),
+        out=offsets[1:]
+    )
+    return list(vocab), tag_idx, offsets
+
+
+def top_counts(keys: np.ndarray, top_n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Most frequent values of an int array.
+
+    Ties are broken by first occurrence, matching Counter.most_common on a
+    Counter filled in array order.
+
+    Args:
+        keys: int array of values
+        top_n: Number of values to return
+
+    Returns:
+        Tuple of (values, counts), sorted by count descending
+    """
+    values, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    order = np.lexsort((first, -counts))[:top_n]
+    return values[order], counts[order]
+
+
+def top_tags_by_cluster(
+    tag_idx: np.ndarray,
+    offsets: np.ndarray,
+    cluster_of: np.ndarray,
+    n_clusters: int,
+    n_tags: int,
+    top_n: int
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Most frequent tags of every cluster at once.
+
+    Args:
+        tag_idx, offsets: Tag arrays from build_tag_arrays
+        cluster_of: int array mapping node position to cluster index (0..n_clusters-1)
+        n_clusters: Number of clusters
+        n_tags: Size of the tag vocabulary
+        top_n: Number of tags per cluster
+
+    Returns:
+        List indexed by cluster index of (tag_ids, counts) arrays, sorted by
+        count descending with ties broken by first occurrence
+    """
+    occurrence_cluster = np.repeat(cluster_of.astype(np.int64), np.diff(offsets))
+    keys = occurrence_cluster * n_tags + tag_idx
+
+    pairs, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    pair_cluster = pairs // n_tags
+    order = np.lexsort((first, -counts, pair_cluster))
+    pair_cluster = pair_cluster[order]
+    pair_tag = (pairs % n_tags)[order]
+    counts = counts[order]
+
+    bounds = np.searchsorted(pair_cluster, np.arange(n_clusters + 1))
+    return [
+        (pair_tag[start:min(end, start + top_n)], counts[start:min(end, start + top_n)])
+        for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+    ]
+
+
+def build_edge_arrays(
+    nodes: list[Node],
+    edges: list[Edge]
+) -> tuple[dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+    """Convert edges to node-position arrays.
+
+    Args:
+        nodes: List of nodes (defines positions)
+        edges: List of edges
+
+    Returns:
+        Tuple of (id_to_idx, src, tgt, resolved)
+        - id_to_idx: node ID -> position in nodes
+        - src, tgt: int32 arrays of endpoint positions (-1 if not a node)
+        - resolved: bool array, True for resolved edges
+    """
+    id_to_idx = {node.id: i for i, node in enumerate(nodes)}
+
+    src = np.fromiter((id_to_idx.get(e.source, -1) for e in edges), dtype=np.int32, count=len(edges))
+    tgt = np.fromiter((id_to_idx.get(e.target, -1) for e in edges), dtype=np.int32, count=len(edges))
+    resolved = np.fromiter((e.resolved for e in edges), dtype=bool, count=len(edges))
+
+    return id_to_idx, src, tgt, resolved
+
+
+def _edge_clusters(
+    src: np.ndarray,
+    tgt: np.ndarray,
+    resolved: np.ndarray,
+    cluster_of: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cluster index of both endpoints for resolved edges between known nodes.
+
+    Returns:
+        Tuple of (edge_idx, source_cluster, target_cluster)
+    """
+    valid = resolved & (src >= 0) & (tgt >= 0)
+    edge_idx = np.flatnonzero(valid)
+    return edge_idx, cluster_of[src[edge_idx]], cluster_of[tgt[edge_idx]]
+
+
+def count_internal_edges(
+    src: np.ndarray,
+    tgt: np.ndarray,
+    resolved: np.ndarray,
+    cluster_of: np.ndarray,
+    cluster_id: int
+) -> int:
+    """Count resolved edges with both endpoints in one cluster.
+
+    Args:
+        src, tgt, resolved: Edge arrays from build_edge_arrays
+        cluster_of: int array mapping node position to cluster index
+        cluster_id: Cluster index to count
+
+    Returns:
+        Number of internal edges (self-loops included)
+    """
+    _, source_cluster, target_cluster = _edge_clusters(src, tgt, resolved, cluster_of)
+    return int(np.count_nonzero((source_cluster == cluster_id) & (target_cluster == cluster_id)))
+
+
+def internal_edge_counts(
+    src: np.ndarray,
+    tgt: np.ndarray,
+    resolved: np.ndarray,
+    cluster_of: np.ndarray,
+    n_clusters: int
+) -> np.ndarray:
+    """Count internal edges for every cluster at once.
+
+    Args:
+        src, tgt, resolved: Edge arrays from build_edge_arrays
+        cluster_of: int array mapping node position to cluster index (0..n_clusters-1)
+        n_clusters: Number of clusters
+
+    Returns:
+        int64 array of internal edge counts indexed by cluster index
+    """
+    _, source_cluster, target_cluster = _edge_clusters(src, tgt, resolved, cluster_of)
+    internal = source_cluster[source_cluster == target_cluster]
+    return np.bincount(internal, minlength=n_clusters)
+
+
+def external_link_clusters(
+    src: np.ndarray,
+    tgt: np.ndarray,
+    resolved: np.ndarray,
+    cluster_of: np.ndarray,
+    cluster_id: int
+) -> np.ndarray:
+    """Cluster at the far end of every resolved edge leaving one cluster.
+
+    Args:
+        src, tgt, resolved: Edge arrays from build_edge_arrays
+        cluster_of: int array mapping node position to cluster (negative if
+            the node has no cluster; such edges are skipped)
+        cluster_id: Cluster to look out from
+
+    Returns:
+        int array of other-cluster values, one per crossing edge, in edge order
+    """
+    _, source_cluster, target_cluster = _edge_clusters(src, tgt, resolved, cluster_of)
+    from_cluster = source_cluster == cluster_id
+    to_cluster = target_cluster == cluster_id
+    other = np.where(from_cluster, target_cluster, source_cluster)
+    return other[(from_cluster != to_cluster) & (other >= 0)]
+
+
+def cross_cluster_links(
+    src: np.ndarray,
+    tgt: np.ndarray,
+    resolved: np.ndarray,
+    cluster_of: np.ndarray,
+    n_clusters: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Count resolved edges between every pair of linked clusters.
+
+    Only pairs that share at least one edge are returned, so memory stays
+    proportional to the edge count rather than n_clusters squared. Each
+    pair appears in both directions.
+
+    Args:
+        src, tgt, resolved: Edge arrays from build_edge_arrays
+        cluster_of: int array mapping node position to cluster index (0..n_clusters-1)
+        n_clusters: Number of clusters
+
+    Returns:
+        Tuple of (from_cluster, to_cluster, counts, first_edge) arrays
+        - counts: number of edges linking the two clusters
+        - first_edge: position of the first such edge, useful for
+          ordering ties the way a sequential edge scan would
+    """
+    edge_idx, source_cluster, target_cluster = _edge_clusters(src, tgt, resolved, cluster_of)
+    cross = source_cluster != target_cluster
+    edge_idx = edge_idx[cross]
+    a = source_cluster[cross].astype(np.int64)
+    b = target_cluster[cross].astype(np.int64)
+
+    # Encode directed pairs as single integers, then group them
+    keys = np.concatenate([a * n_clusters + b, b * n_clusters + a])
+    positions = np.concatenate([edge_idx, edge_idx])
+    order = np.lexsort((positions, keys))
+    keys = keys[order]
+    positions = positions[order]
+
+    pairs, starts, counts = np.unique(keys, return_index=True, return_counts=True)
+    return pairs // n_clusters, pairs % n_clusters, counts, positions[starts]
@@ -1,12 +1,36 @@
 """Centrality metrics for the knowledge graph."""
 
+import heapq
 from typing import Optional
 
 import networkx as nx
+import numpy as np
 
 from ..core.models import Edge, Node
 
 
+def _build_nx_graph(nodes: list[Node], edges: list[Edge], directed: bool = False) -> nx.Graph:
+    """Build a NetworkX graph from nodes and resolved edges.
+
+    Nodes and edges are added in bulk; edge weights are kept so the same
+    graph can serve weighted and unweighted metrics.
+
+    Args:
+        nodes: List of nodes
+        edges: List of edges (unresolved edges are skipped)
+        directed: Build a DiGraph instead of an undirected Graph
+
+    Returns:
+        NetworkX graph keyed by node ID
+    """
+    G = nx.DiGraph() if directed else nx.Graph()
+    G.add_nodes_from(node.id for node in nodes)
+    G.add_weighted_edges_from(
+        (edge.source, edge.target, edge.weight) for edge in edges if edge.resolved
+    )
+    return G
+
+
 def compute_pagerank(nodes: list[Node], edges: list[Edge], damping: float = 0.85) -> None:
     """Compute PageRank centrality and update nodes in place.
 
@@ -15,64 +39,57 @@ def compute_pagerank(nodes: list[Node], edges: list[Edge], damping: float = 0.85
         edges: List of edges for the graph
         damping: PageRank damping factor (default 0.85)
     """
-    G = nx.DiGraph()
+    # Only resolved edges contribute to PageRank
+    G = _build_nx_graph(nodes, edges, directed=True)
 
-    # Add all nodes
-    for node in nodes:
-        G.add_node(node.id)
-
-    # Add edges (only resolved ones contribute to PageRank)
-    for edge in edges:
-        if edge.resolved:
-            G.add_edge(edge.source, edge.target, weight=edge.weight)
-
-    # Compute PageRank
+    # Compute PageRank (NetworkX runs the power iteration on a SciPy sparse matrix)
     try:
         pagerank = nx.pagerank(G, alpha=damping, weight='weight')
     except nx.PowerIterationFailedConvergence:
         # Fall back to simpler calculation
         pagerank = {node.id: 1.0 / len(nodes) for node in nodes}
 
+    if not nodes:
+        return
+
     # Normalize to 0-1 range
-    max_pr = max(pagerank.values()) if pagerank else 1.0
-    if max_pr == 0:
-        max_pr = 1.0
+    scores = np.fromiter((pagerank.get(node.id, 0.0) for node in nodes), dtype=np.float64, count=len(nodes))
+    max_pr = scores.max()
+    scores /= max_pr if max_pr > 0 else 1.0
 
     # Update nodes
-    for node in nodes:
-        node.centrality = pagerank.get(node.id, 0.0) / max_pr
+    for node, score in zip(nodes, scores.tolist()):
+        node.centrality = score
 
 
-def compute_betweenness(nodes: list[Node], edges: list[Edge]) -> dict[str, float]:
+def compute_betweenness(
+    nodes: list[Node],
+    edges: list[Edge],
+    G: Optional[nx.Graph] = None
+) -> dict[str, float]:
     """Compute betweenness centrality.
 
     Returns dict mapping node_id to betweenness score (does not update nodes).
+    Pass a prebuilt undirected graph as G to share it with compute_eigenvector.
     """
-    G = nx.Graph()
-
-    for node in nodes:
-        G.add_node(node.id)
-
-    for edge in edges:
-        if edge.resolved:
-            G.add_edge(edge.source, edge.target)
+    if G is None:
+        G = _build_nx_graph(nodes, edges)
 
     return nx.betweenness_centrality(G)
 
 
-def compute_eigenvector(nodes: list[Node], edges: list[Edge]) -> dict[str, float]:
+def compute_eigenvector(
+    nodes: list[Node],
+    edges: list[Edge],
+    G: Optional[nx.Graph] = None
+) -> dict[str, float]:
     """Compute eigenvector centrality.
 
     Returns dict mapping node_id to eigenvector score.
+    Pass a prebuilt undirected graph as G to share it with compute_betweenness.
     """
-    G = nx.Graph()
-
-    for node in nodes:
-        G.add_node(node.id)
-
-    for edge in edges:
-        if edge.resolved:
-            G.add_edge(edge.source, edge.target)
+    if G is None:
+        G = _build_nx_graph(nodes, edges)
 
     try:
         return nx.eigenvector_centrality(G, max_iter=1000)
@@ -91,5 +108,4 @@ def find_hubs(nodes: list[Node], top_n: int = 10) -> list[Node]:
     Returns:
         Top N nodes by centrality
     """
-    sorted_nodes = sorted(nodes, key=lambda n: n.centrality, reverse=True)
-    return sorted_nodes[:top_n]
+    return heapq.nlargest(top_n, nodes, key=lambda n: n.centrality)
@@ -1,15 +1,21 @@
 """Community detection and clustering for the knowledge graph."""
 
+import heapq
 from typing import Optional
 
 import networkx as nx
+import numpy as np
 
 from ..core.models import Edge, GraphStats, Node
+from ._kernels import build_edge_arrays
 
 
 def compute_clusters(nodes: list[Node], edges: list[Edge]) -> int:
     """Detect communities using Louvain algorithm and update nodes in place.
 
+    Uses igraph's multilevel (Louvain) implementation when python-igraph is
+    installed, otherwise python-louvain on a NetworkX graph.
+
     Args:
         nodes: List of nodes to update with cluster_id
         edges: List of edges for the graph
@@ -17,6 +23,12 @@ def compute_clusters(nodes: list[Node], edges: list[Edge]) -> int:
     Returns:
         Number of clusters found
     """
+    partition = _igraph_partition(nodes, edges)
+    if partition is not None:
+        for node in nodes:
+            node.cluster_id = partition.get(node.id, 0)
+        return len(set(partition.values())) if partition else 1
+
     G = nx.Graph()
 
     # Add all nodes
@@ -58,6 +70,34 @@ def compute_clusters(nodes: list[Node], edges: list[Edge]) -> int:
     return cluster_count
 
 
+def _igraph_partition(nodes: list[Node], edges: list[Edge]) -> Optional[dict[str, int]]:
+    """Louvain partition computed by igraph's C implementation.
+
+    Builds the same simple undirected graph as the NetworkX path (resolved
+    edges, no self-loops, endpoints outside nodes added as vertices).
+
+    Returns:
+        Dict mapping node ID to cluster ID, or None if igraph is not installed
+    """
+    try:
+        import igraph as ig
+    except ImportError:
+        return None
+
+    id_to_idx = {node.id: i for i, node in enumerate(nodes)}
+    pairs = [
+        (id_to_idx.setdefault(edge.source, len(id_to_idx)), id_to_idx.setdefault(edge.target, len(id_to_idx)))
+        for edge in edges
+        if edge.resolved and edge.source != edge.target
+    ]
+
+    g = ig.Graph(n=len(id_to_idx), edges=pairs, directed=False)
+    g.simplify(multiple=True, loops=True)
+    membership = g.community_multilevel().membership
+
+    return {node_id: membership[i] for node_id, i in id_to_idx.items()}
+
+
 def get_cluster_stats(nodes: list[Node]) -> dict[int, dict]:
     """Get statistics for each cluster.
 
@@ -81,7 +121,7 @@ def get_cluster_stats(nodes: list[Node]) -> dict[int, dict]:
             type_counts[type_key] = type_counts.get(type_key, 0) + 1
 
         # Get top nodes by degree
-        top_nodes = sorted(cluster_nodes, key=lambda n: n.degree, reverse=True)[:5]
+        top_nodes = heapq.nlargest(5, cluster_nodes, key=lambda n: n.degree)
 
         stats[cluster_id] = {
             'size': len(cluster_nodes),
@@ -98,21 +138,21 @@ def find_bridges(nodes: list[Node], edges: list[Edge]) -> list[str]:
     Returns:
         List of node IDs that are bridges between clusters
     """
-    # Build adjacency with cluster info
-    node_map = {n.id: n for n in nodes}
-    bridges = []
-
-    for edge in edges:
-        if not edge.resolved:
-            continue
+    _, src, tgt, resolved = build_edge_arrays(nodes, edges)
 
-        source_node = node_map.get(edge.source)
-        target_node = node_map.get(edge.target)
+    # Unclustered nodes (None) get -1 so they differ from every real cluster
+    cluster_of = np.fromiter(
+        (n.cluster_id if n.cluster_id is not None else -1 for n in nodes),
+        dtype=np.int64,
+        count=len(nodes),
+    )
 
-        if source_node and target_node:
-            if source_node.cluster_id != target_node.cluster_id:
-                bridges.append(edge.source)
-                bridges.append(edge.target)
+    # Resolved edges between known nodes in different clusters
+    known = resolved & (src >= 0) & (tgt >= 0)
+    src = src[known]
+    tgt = tgt[known]
+    crossing = cluster_of[src] != cluster_of[tgt]
 
     # Return unique bridge nodes
-    return list(set(bridges))
+    bridge_idx = np.unique(np.concatenate([src[crossing], tgt[crossing]]))
+    return [nodes[i].id for i in bridge_idx.tolist()]
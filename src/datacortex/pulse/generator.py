@@ -1,5 +1,6 @@
 """Pulse snapshot generation and management."""
 
+import gzip
 import json
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +10,11 @@ from ..core.config import DatacortexConfig, load_config
 from ..core.models import Graph, Pulse, PulseChanges
 from ..indexer.graph_builder import build_graph
 
+# Pulses are written as compact gzipped JSON; plain .json pulses from
+# earlier versions are still readable
+PULSE_SUFFIX = ".json.gz"
+LEGACY_PULSE_SUFFIX = ".json"
+
 
 def generate_pulse(
     spaces: Optional[list[str]] = None,
@@ -58,7 +64,7 @@ def generate_pulse(
 
 
 def save_pulse(pulse: Pulse, pulse_dir: Path) -> Path:
-    """Save pulse to JSON file.
+    """Save pulse to a gzipped JSON file.
 
     Args:
         pulse: Pulse to save
@@ -68,32 +74,55 @@ def save_pulse(pulse: Pulse, pulse_dir: Path) -> Path:
         Path to saved file
     """
     pulse_dir.mkdir(parents=True, exist_ok=True)
-    pulse_path = pulse_dir / f"{pulse.id}.json"
+    pulse_path = pulse_dir / f"{pulse.id}{PULSE_SUFFIX}"
 
     data = pulse.model_dump(mode='json')
-    with open(pulse_path, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+    with gzip.open(pulse_path, 'wt', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'), default=str)
 
     return pulse_path
 
 
 def load_pulse(pulse_path: Path) -> Pulse:
-    """Load pulse from JSON file."""
-    with open(pulse_path) as f:
-        data = json.load(f)
+    """Load pulse from a gzipped or plain JSON file."""
+    if pulse_path.name.endswith(PULSE_SUFFIX):
+        with gzip.open(pulse_path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    else:
+        with open(pulse_path) as f:
+            data = json.load(f)
     return Pulse.model_validate(data)
 
 
+def _pulse_files(pulse_dir: Path) -> dict[str, Path]:
+    """Map pulse IDs to their files, preferring gzipped over legacy JSON."""
+    files: dict[str, Path] = {}
+    for f in pulse_dir.glob(f"*{LEGACY_PULSE_SUFFIX}"):
+        files[f.name[:-len(LEGACY_PULSE_SUFFIX)]] = f
+    for f in pulse_dir.glob(f"*{PULSE_SUFFIX}"):
+        files[f.name[:-len(PULSE_SUFFIX)]] = f
+    return files
+
+
+def get_pulse_path(pulse_dir: Path, pulse_id: str) -> Optional[Path]:
+    """Find the file for a pulse ID, or None if it does not exist."""
+    for suffix in (PULSE_SUFFIX, LEGACY_PULSE_SUFFIX):
+        pulse_path = pulse_dir / f"{pulse_id}{suffix}"
+        if pulse_path.exists():
+            return pulse_path
+    return None
+
+
 def load_latest_pulse(pulse_dir: Path) -> Optional[Pulse]:
     """Load the most recent pulse from directory."""
     if not pulse_dir.exists():
         return None
 
-    pulse_files = sorted(pulse_dir.glob("*.json"))
+    pulse_files = _pulse_files(pulse_dir)
     if not pulse_files:
         return None
 
-    return load_pulse(pulse_files[-1])
+    return load_pulse(pulse_files[max(pulse_files)])
 
 
 def list_pulses(pulse_dir: Path) -> list[str]:
@@ -101,11 +130,7 @@ def list_pulses(pulse_dir: Path) -> list[str]:
     if not pulse_dir.exists():
         return []
 
-    pulses = []
-    for f in pulse_dir.glob("*.json"):
-        pulses.append(f.stem)
-
-    return sorted(pulses)
+    return sorted(_pulse_files(pulse_dir))
 
 
 def compute_changes(old_graph: Graph, new_graph: Graph) -> PulseChanges:
@@ -118,11 +143,11 @@ def compute_changes(old_graph: Graph, new_graph: Graph) -> PulseChanges:
     Returns:
         PulseChanges with added/removed nodes and edges
     """
-    old_node_ids = {n.id for n in old_graph.nodes}
-    new_node_ids = {n.id for n in new_graph.nodes}
+    old_node_ids = old_graph.node_id_set
+    new_node_ids = new_graph.node_id_set
 
-    old_edge_ids = {e.id for e in old_graph.edges}
-    new_edge_ids = {e.id for e in new_graph.edges}
+    old_edge_ids = old_graph.edge_id_set
+    new_edge_ids = new_graph.edge_id_set
 
     return PulseChanges(
         nodes_added=list(new_node_ids - old_node_ids),
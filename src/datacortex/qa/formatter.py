@@ -1,5 +1,8 @@
 """Format search results to compact markdown."""
 
+import io
+from typing import BinaryIO
+
 from .retriever import SearchResults
 
 
@@ -12,54 +15,66 @@ def format_search_results(results: SearchResults) -> str:
     Returns:
         Formatted markdown string
     """
-    lines = []
+    buf = io.BytesIO()
+    format_search_results_stream(results, buf)
+
+    # The stream output is newline-terminated; drop the final newline so the
+    # string matches a '\n'.join() of the lines
+    return buf.getvalue()[:-1].decode('utf-8')
 
-    # Header
-    lines.append(f'# SEARCH q="{results.query}"')
-    lines.append('')
 
-    # Parameters
-    lines.append('## PARAMS')
-    lines.append(f'expanded: {str(results.expanded).lower()}')
-    lines.append(f'top_k: {results.top_k}')
-    lines.append(f'generated_at: {results.generated_at}')
-    lines.append('')
+def format_search_results_stream(results: SearchResults, stream: BinaryIO) -> None:
+    """Write search results as UTF-8 markdown to a binary stream.
+
+    Args:
+        results: SearchResults object
+        stream: Binary file-like object to write to
+    """
+    write = stream.write
+
+    # Header and parameters
+    write((
+        f'# SEARCH q="{results.query}"\n'
+        '\n'
+        '## PARAMS\n'
+        f'expanded: {str(results.expanded).lower()}\n'
+        f'top_k: {results.top_k}\n'
+        f'generated_at: {results.generated_at}\n'
+        '\n'
+    ).encode())
 
     # Results
-    lines.append('## RESULTS')
+    write(b'## RESULTS\n')
 
     if not results.results:
-        lines.append('No results found.')
-        return '\n'.join(lines)
+        write(b'No results found.\n')
+        return
 
-    lines.append('')
+    write(b'\n')
 
     for i, result in enumerate(results.results, 1):
-        # Result header
-        lines.append(f'### {i}. {result.title}')
-        lines.append('')
-
-        # Scores
-        lines.append(f'relevance: {result.relevance:.2f}')
-        lines.append(f'vec_score: {result.vec_score:.2f}')
-        lines.append(f'recency: {result.recency_score:.2f}')
-        lines.append(f'centrality: {result.centrality_score:.2f}')
-        lines.append('')
+        # Result header and scores
+        write((
+            f'### {i}. {result.title}\n'
+            '\n'
+            f'relevance: {result.relevance:.2f}\n'
+            f'vec_score: {result.vec_score:.2f}\n'
+            f'recency: {result.recency_score:.2f}\n'
+            f'centrality: {result.centrality_score:.2f}\n'
+            '\n'
+        ).encode())
 
         # Metadata
-        lines.append(f'path: {result.path}')
-        lines.append(f'type: {result.doc_type}')
-        lines.append(f'words: {result.word_count}')
+        write((
+            f'path: {result.path}\n'
+            f'type: {result.doc_type}\n'
+            f'words: {result.word_count}\n'
+        ).encode())
 
         if result.tags:
-            lines.append(f'tags: {", ".join(result.tags)}')
+            write(f'tags: {", ".join(result.tags)}\n'.encode())
 
-        lines.append('')
+        write(b'\n')
 
         # Content
-        lines.append('--- CONTENT ---')
-        lines.append(result.content.strip())
-        lines.append('--- END ---')
-        lines.append('')
-
-    return '\n'.join(lines)
+        write(f'--- CONTENT ---\n{result.content.strip()}\n--- END ---\n\n'.encode())
@@ -1,125 +1,145 @@
 """Re-ranking logic for search results."""
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import Optional
 
 import numpy as np
 
-from ..ai.similarity import cosine_similarity
 
+# Naive timestamps are compared to naive local time, so they are stored as
+# wall-clock seconds since this epoch rather than converted to UTC
+_NAIVE_EPOCH = datetime(1970, 1, 1)
 
-def get_recency_score(updated_at: str) -> float:
-    """Score 0-1, decays over 30 days from today.
+_SECONDS_PER_DAY = 86400.0
+
+# Weights of vec_score, recency and centrality in the final score
+SCORE_WEIGHTS = np.array([0.6, 0.2, 0.2])
+
+# Multiplier for candidates found by the original vector search
+DIRECT_BOOST = 1.2
+
+
+def parse_timestamp(updated_at: str) -> tuple[float, bool]:
+    """Parse an ISO timestamp once for get_recency_scores.
 
     Args:
         updated_at: ISO timestamp string
 
     Returns:
-        Recency score between 0 and 1
+        Tuple of (seconds, naive)
+        - seconds: Unix time for aware timestamps, wall-clock seconds since
+          1970-01-01 for naive ones, -inf if parsing fails (scores as old)
+        - naive: True if the timestamp has no timezone
     """
     try:
         updated = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
     except (ValueError, AttributeError):
-        # If parsing fails, assume old document
-        return 0.0
+        return float('-inf'), False
 
-    now = datetime.now(updated.tzinfo) if updated.tzinfo else datetime.now()
-    age_days = (now - updated).days
-
-    # Linear decay over 30 days
-    if age_days <= 0:
-        return 1.0
-    elif age_days >= 30:
-        return 0.0
-    else:
-        return 1.0 - (age_days / 30.0)
+    if updated.tzinfo is None:
+        return (updated - _NAIVE_EPOCH).total_seconds(), True
+    return updated.timestamp(), False
 
 
-def get_centrality_score(degree: int, max_degree: int) -> float:
-    """Normalize degree to 0-1 range.
+def get_recency_scores(updated_ts: np.ndarray, updated_naive: np.ndarray) -> np.ndarray:
+    """Score 0-1 per document, decaying linearly over 30 days from today.
 
     Args:
-        degree: Node degree (number of connections)
-        max_degree: Maximum degree in the graph
+        updated_ts: float64 array of parsed timestamps
+        updated_naive: bool array, True where the timestamp is naive
 
     Returns:
-        Centrality score between 0 and 1
+        float64 array of recency scores between 0 and 1
     """
-    if max_degree == 0:
-        return 0.0
-    return min(1.0, degree / max_degree)
+    # Every step below reuses this one buffer
+    scores = np.where(
+        updated_naive,
+        (datetime.now() - _NAIVE_EPOCH).total_seconds(),
+        time.time()
+    )
+    scores -= updated_ts
+    scores /= _SECONDS_PER_DAY
+    np.floor(scores, out=scores)
 
+    # Linear decay over 30 days: 1 - age_days / 30
+    scores /= -30.0
+    scores += 1.0
+    return np.clip(scores, 0.0, 1.0, out=scores)
 
-def rerank_results(
-    candidates: list[str],
-    original_candidates: set[str],
-    query_embedding: np.ndarray,
-    embeddings: dict[str, np.ndarray],
-    metadata: dict[str, dict],
-) -> list[tuple[str, float, dict]]:
-    """Re-rank candidates by weighted score.
 
-    Re-ranks candidates using a weighted combination of:
-    - vec_score (60%): cosine similarity to query
-    - recency (20%): how recently updated
-    - centrality (20%): graph connectivity
-    - direct_boost (1.2x): if from original vector search
+def get_centrality_scores(degrees: np.ndarray, max_degree: int) -> np.ndarray:
+    """Normalize degrees to the 0-1 range for a max_degree of at least 1.
 
     Args:
-        candidates: List of file_ids to rank
-        original_candidates: Set of file_ids from original vector search
-        query_embedding: Query embedding vector
-        embeddings: Dict mapping file_id to embedding vector
-        metadata: Dict mapping file_id to metadata dict with 'updated_at', 'degree', 'max_degree'
+        degrees: int array of node degrees
+        max_degree: Maximum degree in the graph
 
     Returns:
-        List of (file_id, final_score, scores_dict) tuples, sorted by final_score descending
-        scores_dict contains: vec_score, recency_score, centrality_score, direct_boost, final_score
+        float64 array of centrality scores between 0 and 1
     """
-    results = []
+    scores = np.divide(degrees, max_degree, dtype=np.float64)
+    return np.minimum(scores, 1.0, out=scores)
 
-    for file_id in candidates:
-        # Skip if no embedding
-        if file_id not in embeddings:
-            continue
 
-        # Get metadata
-        meta = metadata.get(file_id, {})
+def top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, highest first.
 
-        # Vector similarity score
-        vec_score = cosine_similarity(query_embedding, embeddings[file_id])
+    Equivalent to np.argsort(-scores, kind='stable')[:k] (ties keep index
+    order) but selects with argpartition, so only the top k are sorted.
 
-        # Recency score
-        updated_at = meta.get('updated_at', '')
-        recency_score = get_recency_score(updated_at)
+    Args:
+        scores: 1-D array of scores
+        k: Number of indices to return
 
-        # Centrality score
-        degree = meta.get('degree', 0)
-        max_degree = meta.get('max_degree', 1)
-        centrality_score = get_centrality_score(degree, max_degree)
+    Returns:
+        int array of at most k indices
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= len(scores):
+        return np.argsort(-scores, kind='stable')
 
-        # Direct match boost (1.2x for original vector search results)
-        direct_boost = 1.2 if file_id in original_candidates else 1.0
+    # Keep every score tied with the k-th so the cut matches a stable sort
+    kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+    selected = np.flatnonzero(scores >= kth)
+    return selected[np.argsort(-scores[selected], kind='stable')][:k]
 
-        # Weighted final score
-        weighted_score = (
-            vec_score * 0.6 +
-            recency_score * 0.2 +
-            centrality_score * 0.2
-        )
-        final_score = weighted_score * direct_boost
 
-        scores = {
-            'vec_score': vec_score,
-            'recency_score': recency_score,
-            'centrality_score': centrality_score,
-            'direct_boost': direct_boost,
-            'final_score': final_score,
-        }
+def rerank_results(
+    component_scores: np.ndarray,
+    is_original: np.ndarray,
+    top_k: Optional[int] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Re-rank candidates by weighted score.
 
-        results.append((file_id, final_score, scores))
+    Re-ranks candidates using a weighted combination of:
+    - vec_score (60%): cosine similarity to query
+    - recency (20%): how recently updated
+    - centrality (20%): graph connectivity
+    - direct_boost (1.2x): if from original vector search
+
+    Args:
+        component_scores: (n, 3) float array with one row per candidate:
+            vec_score, recency_score (see get_recency_scores) and
+            centrality_score (see get_centrality_scores)
+        is_original: bool array, True for candidates from the original vector search
+        top_k: Only order the best top_k candidates (default: all)
+
+    Returns:
+        Tuple of (order, final_scores)
+        - order: candidate positions sorted by final score descending
+          (ties keep candidate order), at most top_k of them
+        - final_scores: final score of each candidate, in candidate order
+    """
+    # Weighted final score, then direct match boost for original results
+    final_scores = component_scores @ SCORE_WEIGHTS
+    np.multiply(final_scores, DIRECT_BOOST, out=final_scores, where=is_original)
 
     # Sort by final score descending
-    results.sort(key=lambda x: -x[1])
+    if top_k is None:
+        order = np.argsort(-final_scores, kind='stable')
+    else:
+        order = top_indices(final_scores, top_k)
 
-    return results
+    return order, final_scores
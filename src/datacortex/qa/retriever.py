@@ -1,34 +1,20 @@
 """RAG retrieval pipeline for question answering."""
 
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
-
-import re
+from functools import lru_cache
+from typing import Optional
 
 import numpy as np
 
-from ..ai.cache import get_cached_embedding, init_embeddings_table
+from ..ai.cache import init_embeddings_table, load_embedding_matrix
 from ..ai.embeddings import embed_text
-from ..ai.similarity import cosine_similarity
-from ..core.database import get_connection
-from .ranker import rerank_results
-
-
-def _detect_space_from_path(path: str, spaces: list[str]) -> str:
-    """Detect space key from a file path by matching [0-9]-name/ pattern."""
-    match = re.search(r'(\d+)-([^/]+)/', path)
-    if match:
-        name = match.group(2)
-        if name in spaces:
-            return name
-        # Try matching without number prefix
-        for s in spaces:
-            if s == name or path.find(f'{match.group(0)}') >= 0:
-                return s
-    return spaces[0] if spaces else 'personal'
+from ..core.database import get_connection, get_db_version
+from .ranker import get_centrality_scores, get_recency_scores, parse_timestamp, rerank_results, top_indices
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Single search result with metadata and content."""
     file_id: str
@@ -44,7 +30,49 @@ class SearchResult:
     content: str  # full content
 
 
+# Most values bound in one IN (...) list, below SQLite's parameter limit
+_MAX_SQL_PARAMS = 500
+
+# Rows dequantized per block when scoring int8 embeddings
+_Q8_BLOCK_ROWS = 8192
+
+
 @dataclass
+class SpaceStore:
+    """Cached embeddings and metadata for one space, one row per document.
+
+    Row i of every field describes the document ids[i].
+    """
+    space: str
+    ids: list[str]
+    id_to_row: dict[str, int]
+    embeddings: np.ndarray  # (N, D) rows L2-normalised; float32, or int8 if scales is set
+    titles: list[str]
+    paths: list[str]
+    types: list[str]
+    updated_ts: np.ndarray  # float64, see ranker.parse_timestamp
+    updated_naive: np.ndarray  # bool, True for timestamps without timezone
+    word_counts: list[int]
+    tags: list[list[str]]
+    degrees: np.ndarray  # resolved links in + out
+    max_degree: int  # highest degree among the space's files (at least 1)
+    scales: Optional[np.ndarray] = None  # float32 per-row scale of int8 embeddings
+
+    def similarities(self, query_norm: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row to a normalised query."""
+        if self.scales is None:
+            return self.embeddings @ query_norm
+
+        # Dequantize one block at a time to keep the float copy small
+        sims = np.empty(len(self.ids), dtype=np.float32)
+        for start in range(0, len(self.ids), _Q8_BLOCK_ROWS):
+            block = self.embeddings[start:start + _Q8_BLOCK_ROWS]
+            np.matmul(block.astype(np.float32), query_norm, out=sims[start:start + _Q8_BLOCK_ROWS])
+        sims *= self.scales
+        return sims
+
+
+@dataclass(slots=True)
 class SearchResults:
     """Collection of search results with metadata."""
     query: str
@@ -54,31 +82,63 @@ class SearchResults:
     generated_at: str
 
 
-def load_embeddings_for_space(space: str) -> tuple[dict[str, np.ndarray], dict[str, dict]]:
-    """Load all cached embeddings and metadata for a space.
+def quantize_rows(embeddings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Quantize float rows to int8 with one symmetric scale per row.
+
+    Args:
+        embeddings: (N, D) float array
+
+    Returns:
+        Tuple of (int8 matrix, float32 scales) with row i ~= q8[i] * scales[i]
+    """
+    scales = np.abs(embeddings).max(axis=1) / 127.0 if embeddings.size else np.zeros(len(embeddings))
+    scales[scales == 0] = 1.0
+    q8 = np.rint(embeddings / scales[:, None]).astype(np.int8)
+    return q8, scales.astype(np.float32)
+
+
+def load_space_store(space: str, quantize: bool = False) -> SpaceStore:
+    """Load all cached embeddings and their file metadata for a space.
 
     Args:
         space: Space name
+        quantize: Keep embeddings as int8 with per-row scales (about 4x less
+            memory, similarities accurate to roughly 1e-2)
 
     Returns:
-        Tuple of (embeddings_dict, metadata_dict)
-        - embeddings_dict: file_id -> embedding vector
-        - metadata_dict: file_id -> {title, path, type, updated_at, degree, tags, word_count}
+        SpaceStore with one row per cached embedding
     """
     conn = get_connection(space)
     init_embeddings_table(conn)
 
-    embeddings = {}
-    metadata = {}
-
-    # Load embeddings from cache
-    cursor = conn.execute("""
-        SELECT file_id, embedding
-        FROM embeddings
-    """)
-
-    for row in cursor:
-        embeddings[row['file_id']] = np.frombuffer(row['embedding'], dtype=np.float32)
+    # Map the packed, already normalised matrix when it can be used
+    packed = load_embedding_matrix(conn)
+    if packed is not None:
+        ids, embeddings = packed
+    else:
+        # Load embeddings from cache straight into one preallocated matrix
+        count, blob_size = conn.execute("""
+            SELECT COUNT(*), MAX(LENGTH(embedding))
+            FROM embeddings
+        """).fetchone()
+        embeddings = np.empty((count, (blob_size or 0) // 4), dtype=np.float32)
+
+        ids = []
+        for row in conn.execute("""
+            SELECT file_id, embedding
+            FROM embeddings
+            LIMIT ?
+        """, (count,)):
+            embeddings[len(ids)] = np.frombuffer(row['embedding'], dtype=np.float32)
+            ids.append(row['file_id'])
+
+        # Rows deleted since the count leave the tail unused
+        embeddings = embeddings[:len(ids)]
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    scales = None
+    if quantize:
+        embeddings, scales = quantize_rows(embeddings)
 
     # Load metadata from files
     cursor = conn.execute("""
@@ -88,125 +148,175 @@ def load_embeddings_for_space(space: str) -> tuple[dict[str, np.ndarray], dict[s
 
     files_meta = {}
     for row in cursor:
-        files_meta[row['id']] = {
-            'title': row['title'] or row['id'],
-            'path': row['path'],
-            'type': row['type'],
-            'updated_at': row['updated_at'],
-            'word_count': row['word_count'] or 0,
-        }
-
-    # Load tags
+        files_meta[row['id']] = (
+            row['title'] or row['id'],
+            row['path'],
+            row['type'],
+            row['updated_at'],
+            row['word_count'] or 0,
+        )
+
+    # Load tags, one row per tag; ordering by file keeps each file's tags in one run
     cursor = conn.execute("""
-        SELECT file_id, GROUP_CONCAT(normalized_tag, ',') as tags
+        SELECT file_id, normalized_tag
         FROM tags
-        GROUP BY file_id
+        ORDER BY file_id
     """)
 
-    tags_map = {}
-    for row in cursor:
-        if row['tags']:
-            tags_map[row['file_id']] = [t for t in row['tags'].split(',') if t]
+    tags_map: dict[str, list[str]] = {}
+    current_id = None
+    for file_id, tag in cursor:
+        if tag:
+            if file_id != current_id:
+                current_tags = tags_map.setdefault(file_id, [])
+                current_id = file_id
+            current_tags.append(tag)
 
-    # Load degrees (count incoming + outgoing links)
+    # Load degrees (incoming + outgoing links) of files in the space
     cursor = conn.execute("""
-        SELECT source_id as file_id, COUNT(*) as degree
-        FROM links
-        WHERE resolved = 1
-        GROUP BY source_id
+        SELECT file_id, SUM(degree) as degree
+        FROM (
+            SELECT source_id as file_id, COUNT(*) as degree
+            FROM links
+            WHERE resolved = 1
+            GROUP BY source_id
+            UNION ALL
+            SELECT target_id as file_id, COUNT(*) as degree
+            FROM links
+            WHERE resolved = 1 AND target_id IS NOT NULL
+            GROUP BY target_id
+        )
+        WHERE file_id IN (SELECT id FROM files)
+        GROUP BY file_id
     """)
+    degree_map = dict(cursor.fetchall())
 
-    degree_out = {}
-    for row in cursor:
-        degree_out[row['file_id']] = row['degree']
+    conn.close()
 
-    cursor = conn.execute("""
-        SELECT target_id as file_id, COUNT(*) as degree
-        FROM links
-        WHERE resolved = 1 AND target_id IS NOT NULL
-        GROUP BY target_id
-    """)
+    # Max degree is taken over all files in the space, embedded or not
+    max_degree = max(1, max(degree_map.values(), default=0))
+
+    # Embeddings without a files row fall back to placeholder metadata
+    rows_meta = [files_meta.get(file_id) or (file_id, '', 'unknown', '', 0) for file_id in ids]
+
+    # Parse timestamps once here rather than per candidate at query time
+    timestamps = [parse_timestamp(meta[3]) for meta in rows_meta]
+
+    return SpaceStore(
+        space=space,
+        ids=ids,
+        id_to_row={file_id: i for i, file_id in enumerate(ids)},
+        embeddings=embeddings,
+        titles=[meta[0] for meta in rows_meta],
+        paths=[meta[1] for meta in rows_meta],
+        types=[meta[2] for meta in rows_meta],
+        updated_ts=np.fromiter((ts for ts, _ in timestamps), dtype=np.float64, count=len(ids)),
+        updated_naive=np.fromiter((naive for _, naive in timestamps), dtype=bool, count=len(ids)),
+        word_counts=[meta[4] for meta in rows_meta],
+        tags=[tags_map.get(file_id, []) for file_id in ids],
+        degrees=np.fromiter((degree_map.get(file_id, 0) for file_id in ids), dtype=np.int64, count=len(ids)),
+        max_degree=max_degree,
+        scales=scales,
+    )
 
-    degree_in = {}
-    for row in cursor:
-        degree_in[row['file_id']] = row['degree']
 
-    # Combine metadata
-    max_degree = 1
-    for file_id in files_meta:
-        degree = degree_out.get(file_id, 0) + degree_in.get(file_id, 0)
-        max_degree = max(max_degree, degree)
+@lru_cache(maxsize=8)
+def _load_space_store_cached(space: str, version: Optional[tuple], quantize: bool) -> SpaceStore:
+    """load_space_store memoised per database version; arrays are read-only."""
+    store = load_space_store(space, quantize=quantize)
+    for array in (store.embeddings, store.updated_ts, store.updated_naive, store.degrees, store.scales):
+        if array is not None:
+            array.flags.writeable = False
+    return store
 
-        metadata[file_id] = {
-            **files_meta[file_id],
-            'degree': degree,
-            'max_degree': max_degree,  # Will update after we know max
-            'tags': tags_map.get(file_id, []),
-        }
 
-    # Update max_degree for all
-    for file_id in metadata:
-        metadata[file_id]['max_degree'] = max_degree
+def get_space_store(space: str, quantize: bool = False) -> SpaceStore:
+    """Get the SpaceStore for a space, reloading only when its database changes.
+
+    Args:
+        space: Space name
+        quantize: Load int8 embeddings (see load_space_store)
+
+    Returns:
+        Shared SpaceStore (do not modify)
+    """
+    return _load_space_store_cached(space, get_db_version(space), quantize)
 
-    conn.close()
 
-    return embeddings, metadata
+def _chunks(items: list[str], size: int = _MAX_SQL_PARAMS):
+    """Yield consecutive slices of at most size items (SQLite parameter limit)."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 def expand_with_neighbors(
     candidates: list[str],
     space: str,
-    depth: int = 1
+    depth: int = 1,
+    conn: Optional[sqlite3.Connection] = None
 ) -> set[str]:
-    """Add 1-hop neighbors to candidate set.
+    """Add neighbors up to depth hops away to candidate set.
 
     Args:
         candidates: Initial candidate file_ids
         space: Space name
         depth: Expansion depth (default 1)
+        conn: Open connection to the space's database (default: open and
+            close one here)
 
     Returns:
         Expanded set of file_ids
     """
-    conn = get_connection(space)
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection(space)
 
     expanded = set(candidates)
-
-    # Get outgoing neighbors
-    placeholders = ','.join('?' * len(candidates))
-    cursor = conn.execute(f"""
-        SELECT DISTINCT target_id
-        FROM links
-        WHERE source_id IN ({placeholders})
-          AND resolved = 1
-          AND target_id IS NOT NULL
-    """, candidates)
-
-    for row in cursor:
-        expanded.add(row['target_id'])
-
-    # Get incoming neighbors
-    cursor = conn.execute(f"""
-        SELECT DISTINCT source_id
-        FROM links
-        WHERE target_id IN ({placeholders})
-          AND resolved = 1
-    """, candidates)
-
-    for row in cursor:
-        expanded.add(row['source_id'])
-
-    conn.close()
+    frontier = list(expanded)
+
+    # One query per hop returns both outgoing and incoming neighbors; each
+    # chunk is bound twice, so chunks are half the parameter limit
+    for _ in range(depth):
+        neighbors = set()
+        for chunk in _chunks(frontier, _MAX_SQL_PARAMS // 2):
+            placeholders = ','.join('?' * len(chunk))
+            cursor = conn.execute(f"""
+                SELECT target_id AS neighbor_id
+                FROM links
+                WHERE source_id IN ({placeholders})
+                  AND resolved = 1
+                  AND target_id IS NOT NULL
+                UNION
+                SELECT source_id
+                FROM links
+                WHERE target_id IN ({placeholders})
+                  AND resolved = 1
+            """, chunk + chunk)
+            neighbors.update(row[0] for row in cursor)
+
+        frontier = list(neighbors - expanded)
+        expanded |= neighbors
+        if not frontier:
+            break
+
+    if own_conn:
+        conn.close()
 
     return expanded
 
 
-def load_full_content(space: str, file_ids: list[str]) -> dict[str, str]:
+def load_full_content(
+    space: str,
+    file_ids: list[str],
+    conn: Optional[sqlite3.Connection] = None
+) -> dict[str, str]:
     """Load full content for multiple documents.
 
     Args:
         space: Space name
         file_ids: List of file IDs to load
+        conn: Open connection to the space's database (default: open and
+            close one here)
 
     Returns:
         Dict mapping file_id to content string
@@ -214,153 +324,210 @@ def load_full_content(space: str, file_ids: list[str]) -> dict[str, str]:
     if not file_ids:
         return {}
 
-    conn = get_connection(space)
-
-    placeholders = ','.join('?' * len(file_ids))
-    cursor = conn.execute(f"""
-        SELECT id, content
-        FROM files
-        WHERE id IN ({placeholders})
-    """, file_ids)
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection(space)
 
     content_map = {}
-    for row in cursor:
-        content_map[row['id']] = row['content'] or ''
+    for chunk in _chunks(file_ids):
+        placeholders = ','.join('?' * len(chunk))
+        cursor = conn.execute(f"""
+            SELECT id, content
+            FROM files
+            WHERE id IN ({placeholders})
+        """, chunk)
 
-    conn.close()
+        for row in cursor:
+            content_map[row['id']] = row['content'] or ''
 
-    return content_map
+    if own_conn:
+        conn.close()
 
+    return content_map
 
-def search(query: str, spaces: list[str], top_k: int = 5, expand: bool = True) -> SearchResults:
-    """RAG retrieval pipeline.
 
-    Pipeline:
-    1. Embed query using same model as corpus
-    2. Load all embeddings from cache
-    3. Vector search - find top 10 candidates by cosine similarity
-    4. Graph expansion (if enabled) - add 1-hop neighbors
-    5. Re-rank all candidates:
-       - vec_score * 0.6 + recency * 0.2 + centrality * 0.2
-       - Direct match boost: 1.2x for original candidates
-    6. Take top_k results
-    7. Load full content for each result
+def _rank_stores(
+    query_norm: np.ndarray,
+    stores: list[SpaceStore],
+    top_k: int,
+    expand: bool,
+    conns: dict[str, sqlite3.Connection]
+) -> list[SearchResult]:
+    """Steps 3-7 of search(): vector search, expansion, re-ranking, content.
 
     Args:
-        query: Search query string
-        spaces: List of space names to search
-        top_k: Number of results to return (default 5)
-        expand: Whether to expand with graph neighbors (default True)
+        query_norm: L2-normalised query embedding
+        stores: Non-empty space stores to search
+        top_k: Number of results to return
+        expand: Whether to expand with graph neighbors
+        conns: Open connections by space; connections opened here are
+            added to it so the caller can close them
 
     Returns:
-        SearchResults object with ranked results
+        Ranked search results
     """
-    # Step 1: Embed query
-    query_embedding = embed_text(query)
-
-    # Step 2: Load embeddings and metadata from all spaces
-    all_embeddings = {}
-    all_metadata = {}
-
-    for space in spaces:
-        embeddings, metadata = load_embeddings_for_space(space)
-        all_embeddings.update(embeddings)
-        all_metadata.update(metadata)
-
-    if not all_embeddings:
-        return SearchResults(
-            query=query,
-            results=[],
-            expanded=expand,
-            top_k=top_k,
-            generated_at=datetime.now().isoformat()
-        )
-
-    # Step 3: Vector search - find top 10 candidates by cosine similarity
-    candidates = []
-    for file_id, embedding in all_embeddings.items():
-        similarity = cosine_similarity(query_embedding, embedding)
-        candidates.append((file_id, similarity))
-
-    candidates.sort(key=lambda x: -x[1])
-    top_10_candidates = [c[0] for c in candidates[:10]]
+    # (store index, row) for every file; later spaces win for duplicate file IDs
+    locations = {
+        file_id: (k, row)
+        for k, store in enumerate(stores)
+        for file_id, row in store.id_to_row.items()
+    }
+
+    def space_conn(space: str) -> sqlite3.Connection:
+        if space not in conns:
+            conns[space] = get_connection(space)
+        return conns[space]
+
+    # Step 3: Vector search - find top 10 candidates by cosine similarity,
+    # scoring every document with one matrix-vector product per space;
+    # store k's rows start at offsets[k]
+    similarities = np.concatenate([store.similarities(query_norm) for store in stores])
+    offsets = np.cumsum([0] + [len(store.ids) for store in stores])
+    file_ids = [file_id for store in stores for file_id in store.ids]
+
+    # Score each file ID once: rows shadowed by a later space's copy are left out
+    unique_rows = np.fromiter(
+        (offsets[k] + row for k, row in locations.values()), dtype=np.intp, count=len(locations)
+    )
+    unique_rows.sort()
+    top_rows = unique_rows[top_indices(similarities[unique_rows], 10)]
+    top_10_candidates = [file_ids[i] for i in top_rows.tolist()]
     original_candidates = set(top_10_candidates)
 
     # Step 4: Graph expansion (if enabled)
     expanded_candidates = []
     if expand:
-        # For each space, expand within that space
+        # For each space, expand within that space; every store knows its space
         space_candidates = {}
         for file_id in top_10_candidates:
-            meta = all_metadata.get(file_id, {})
-            # Determine space from path dynamically
-            path = meta.get('path', '')
-            space_key = _detect_space_from_path(path, spaces)
-
-            if space_key not in space_candidates:
-                space_candidates[space_key] = []
-            space_candidates[space_key].append(file_id)
+            space_key = stores[locations[file_id][0]].space
+            space_candidates.setdefault(space_key, []).append(file_id)
 
         # Expand within each space
         expanded_set = set(top_10_candidates)
         for space_key, space_cands in space_candidates.items():
-            if space_key in spaces:
-                expanded_set.update(expand_with_neighbors(space_cands, space_key))
+            expanded_set.update(expand_with_neighbors(space_cands, space_key, conn=space_conn(space_key)))
 
         expanded_candidates = list(expanded_set)
     else:
         expanded_candidates = top_10_candidates
 
-    # Step 5: Re-rank all candidates
-    ranked = rerank_results(
-        candidates=expanded_candidates,
-        original_candidates=original_candidates,
-        query_embedding=query_embedding,
-        embeddings=all_embeddings,
-        metadata=all_metadata,
+    # Step 5: Re-rank all candidates that have an embedding
+    ranked_ids = [file_id for file_id in expanded_candidates if file_id in locations]
+    n_ranked = len(ranked_ids)
+    ranked_store = np.fromiter((locations[file_id][0] for file_id in ranked_ids), dtype=np.intp, count=n_ranked)
+    ranked_rows = np.fromiter((locations[file_id][1] for file_id in ranked_ids), dtype=np.intp, count=n_ranked)
+
+    # One row per candidate: vec_score, recency, centrality; vector scores
+    # were computed for every document in step 3 and are reused as is
+    component_scores = np.empty((n_ranked, 3), dtype=np.float64)
+    component_scores[:, 0] = similarities[offsets[ranked_store] + ranked_rows]
+    for k, store in enumerate(stores):
+        in_store = np.flatnonzero(ranked_store == k)
+        rows = ranked_rows[in_store]
+        component_scores[in_store, 1] = get_recency_scores(store.updated_ts[rows], store.updated_naive[rows])
+        component_scores[in_store, 2] = get_centrality_scores(store.degrees[rows], store.max_degree)
+    is_original = np.fromiter(
+        (file_id in original_candidates for file_id in ranked_ids), dtype=bool, count=n_ranked
     )
 
     # Step 6: Take top_k results
-    top_results = ranked[:top_k]
+    order, final_scores = rerank_results(component_scores, is_original, top_k=top_k)
+    top_results = order.tolist()
+    result_locations = {i: (stores[ranked_store[i]], int(ranked_rows[i])) for i in top_results}
 
-    # Step 7: Load full content
-    # Group by space - detect from path patterns
+    # Step 7: Load full content, grouped by the space each result came from
     space_file_ids = {}
-    for file_id, _, _ in top_results:
-        meta = all_metadata.get(file_id, {})
-        path = meta.get('path', '')
-        space_key = _detect_space_from_path(path, spaces)
-
-        if space_key not in space_file_ids:
-            space_file_ids[space_key] = []
-        space_file_ids[space_key].append(file_id)
+    for i in top_results:
+        store, _ = result_locations[i]
+        space_file_ids.setdefault(store.space, []).append(ranked_ids[i])
 
     all_content = {}
-    for space_key, file_ids in space_file_ids.items():
-        if space_key in spaces:
-            all_content.update(load_full_content(space_key, file_ids))
+    for space_key, ids in space_file_ids.items():
+        all_content.update(load_full_content(space_key, ids, conn=space_conn(space_key)))
 
     # Build search results
     results = []
-    for file_id, final_score, scores in top_results:
-        meta = all_metadata.get(file_id, {})
-        content = all_content.get(file_id, '')
+    for i in top_results:
+        file_id = ranked_ids[i]
+        store, row = result_locations[i]
+        vec_score, recency_score, centrality_score = component_scores[i].tolist()
 
+        # Positional, in field order
         result = SearchResult(
-            file_id=file_id,
-            title=meta.get('title', file_id),
-            path=meta.get('path', ''),
-            doc_type=meta.get('type', 'unknown'),
-            word_count=meta.get('word_count', 0),
-            tags=meta.get('tags', []),
-            relevance=scores['final_score'],
-            vec_score=scores['vec_score'],
-            recency_score=scores['recency_score'],
-            centrality_score=scores['centrality_score'],
-            content=content,
+            file_id,
+            store.titles[row],
+            store.paths[row],
+            store.types[row],
+            store.word_counts[row],
+            store.tags[row],
+            float(final_scores[i]),
+            vec_score,
+            recency_score,
+            centrality_score,
+            all_content.get(file_id, ''),
         )
         results.append(result)
 
+    return results
+
+
+def search(
+    query: str,
+    spaces: list[str],
+    top_k: int = 5,
+    expand: bool = True,
+    quantize: bool = False
+) -> SearchResults:
+    """RAG retrieval pipeline.
+
+    Pipeline:
+    1. Embed query using same model as corpus
+    2. Load all embeddings from cache
+    3. Vector search - find top 10 candidates by cosine similarity
+    4. Graph expansion (if enabled) - add 1-hop neighbors
+    5. Re-rank all candidates:
+       - vec_score * 0.6 + recency * 0.2 + centrality * 0.2
+       - Direct match boost: 1.2x for original candidates
+    6. Take top_k results
+    7. Load full content for each result
+
+    Args:
+        query: Search query string
+        spaces: List of space names to search
+        top_k: Number of results to return (default 5)
+        expand: Whether to expand with graph neighbors (default True)
+        quantize: Score against int8-quantized embeddings to cut memory use
+            for large corpora (default False)
+
+    Returns:
+        SearchResults object with ranked results
+    """
+    # Step 1: Embed query
+    query_embedding = embed_text(query)
+
+    # Step 2: Load embeddings and metadata from all spaces
+    stores = [store for store in (get_space_store(space, quantize) for space in spaces) if store.ids]
+
+    if not stores:
+        return SearchResults(
+            query=query,
+            results=[],
+            expanded=expand,
+            top_k=top_k,
+            generated_at=datetime.now().isoformat()
+        )
+
+    # Steps 3-7: rank and load content over one connection per space,
+    # closed however ranking exits
+    query_norm = query_embedding / np.linalg.norm(query_embedding)
+    conns: dict[str, sqlite3.Connection] = {}
+    try:
+        results = _rank_stores(query_norm, stores, top_k, expand, conns)
+    finally:
+        for conn in conns.values():
+            conn.close()
+
     return SearchResults(
         query=query,
         results=results,
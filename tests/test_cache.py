@@ -0,0 +1,45 @@
+"""Tests for the embedding cache."""
+
+import sqlite3
+
+import numpy as np
+
+from datacortex.ai.cache import (
+    init_embeddings_table,
+    load_embedding_matrix,
+    refresh_embedding_matrix,
+    save_embedding,
+)
+
+
+def test_embedding_matrix_written_by_writer_and_read_only_by_reader(tmp_path):
+    """Readers never write; a stale or missing matrix means falling back to BLOBs."""
+    db_path = tmp_path / 'knowledge.db'
+    conn = sqlite3.connect(db_path)
+
+    # Table from before row_idx existed
+    conn.execute("""
+        CREATE TABLE embeddings (
+            file_id TEXT PRIMARY KEY,
+            embedding BLOB NOT NULL,
+            model TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    save_embedding(conn, 'a', np.array([3.0, 4.0]), 'm', 'h1')
+    save_embedding(conn, 'b', np.array([0.0, 2.0]), 'm', 'h2')
+
+    read_only = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    init_embeddings_table(read_only)
+    assert load_embedding_matrix(read_only) is None
+    assert not (tmp_path / 'embeddings.f32').exists()
+
+    assert refresh_embedding_matrix(conn)
+    ids, matrix = load_embedding_matrix(read_only)
+    assert ids == ['a', 'b']
+    np.testing.assert_allclose(matrix, [[0.6, 0.8], [0.0, 1.0]])
+
+    # Replacing an embedding marks the matrix stale until the writer refreshes it
+    save_embedding(conn, 'a', np.array([1.0, 0.0]), 'm', 'h3')
+    assert load_embedding_matrix(read_only) is None
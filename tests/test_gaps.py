@@ -0,0 +1,41 @@
+"""Tests for gap detection."""
+
+import numpy as np
+import pytest
+
+from datacortex.core.models import Edge, Graph, Node
+
+pytest.importorskip("sentence_transformers")
+
+from datacortex.gaps import detector
+
+
+def test_detect_gaps_skips_small_clusters_before_pair_scoring(monkeypatch):
+    """Singleton clusters never reach the KxK pair arrays."""
+    nodes = [Node(id=f'a{i}', title=f'A{i}', path=f'/a{i}', space='test', cluster_id=1) for i in range(3)]
+    nodes += [Node(id=f'b{i}', title=f'B{i}', path=f'/b{i}', space='test', cluster_id=2) for i in range(3)]
+    nodes += [Node(id=f's{i}', title=f'S{i}', path=f'/s{i}', space='test', cluster_id=10 + i) for i in range(2000)]
+    graph = Graph(nodes=nodes, edges=[Edge(id='e1', source='a0', target='b0', resolved=True)])
+    graph.stats.cluster_count = 2002
+
+    embeddings = {node.id: np.array([1.0, 0.1, 0.0]) for node in nodes}
+
+    monkeypatch.setattr(detector, 'build_graph', lambda spaces, config: graph)
+    monkeypatch.setattr(detector, 'space_exists', lambda space: True)
+    monkeypatch.setattr(detector, 'compute_embeddings_for_space', lambda space, force: embeddings)
+
+    pair_counts = []
+    score_cluster_pairs = detector.score_cluster_pairs
+
+    def recording_score_cluster_pairs(centroids, cross_links, sizes, min_gap_score):
+        pair_counts.append(cross_links.shape)
+        return score_cluster_pairs(centroids, cross_links, sizes, min_gap_score)
+
+    monkeypatch.setattr(detector, 'score_cluster_pairs', recording_score_cluster_pairs)
+
+    result = detector.detect_gaps(['test'], min_gap_score=0.3)
+
+    assert pair_counts == [(2, 2)]
+    assert result.cluster_count == 2002
+    assert [(gap.cluster_a, gap.cluster_b, gap.cross_links) for gap in result.gaps] == [(1, 2, 1)]
+    assert result.gaps[0].link_density == pytest.approx(1 / 9)
@@ -0,0 +1,39 @@
+"""Tests for graph building."""
+
+import sqlite3
+
+from datacortex.core.config import DatacortexConfig, GraphConfig
+from datacortex.indexer import graph_builder
+
+
+def mk_conn():
+    """In-memory database with two files, one link between them and one dangling unresolved link."""
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE files (
+            id TEXT PRIMARY KEY, path TEXT, space TEXT, type TEXT, title TEXT, word_count INTEGER,
+            maturity TEXT, is_stub INTEGER, created_at TEXT, updated_at TEXT
+        );
+        CREATE TABLE links (source_id TEXT, target_id TEXT, target_title TEXT, syntax TEXT, resolved INTEGER);
+        CREATE TABLE tags (file_id TEXT, normalized_tag TEXT);
+
+        INSERT INTO files VALUES ('a', '/a', 'test', 'zettel', 'A', 10, NULL, 0, NULL, NULL);
+        INSERT INTO files VALUES ('b', '/b', 'test', 'zettel', 'B', 10, NULL, 0, NULL, NULL);
+        INSERT INTO links VALUES ('a', 'b', 'B', 'wiki-link', 1);
+        INSERT INTO links VALUES ('a', NULL, NULL, 'wiki-link', 0);
+    """)
+    return conn
+
+
+def test_build_graph_skips_unresolved_link_without_target(monkeypatch):
+    """A filtered-out link row with no target_id or target_title is skipped, not interned."""
+    monkeypatch.setattr(graph_builder, 'space_exists', lambda space: True)
+    monkeypatch.setattr(graph_builder, 'get_connection', lambda space: mk_conn())
+    config = DatacortexConfig(graph=GraphConfig(
+        include_unresolved=False, compute_centrality=False, compute_clusters=False
+    ))
+
+    graph = graph_builder.build_graph(spaces=['test'], config=config)
+
+    assert [(edge.source, edge.target) for edge in graph.edges] == [('a', 'b')]
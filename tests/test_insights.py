@@ -1,30 +1,129 @@
 """Tests for insights module."""
 
+from functools import lru_cache
+
+import numpy as np
 import pytest
-from datacortex.insights.analyzer import (
-    ClusterAnalysis,
-    InsightsResult,
-    get_cluster_stats,
-    get_hub_documents,
-    get_tag_frequency,
-    get_cluster_connections,
-)
-from datacortex.insights.formatter import format_insights, format_cluster_summary
-from datacortex.core.models import Node, Edge, NodeType
-
-
-def test_cluster_analysis_dataclass():
-    """Test ClusterAnalysis dataclass creation."""
-    analysis = ClusterAnalysis(
-        cluster_id=1,
-        size=10,
+from datacortex.core.models import Node, Edge, Graph, NodeType
+
+
+# The insights modules pull in networkx and the database layer, so they are
+# imported on first use rather than at collection time
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """The datacortex.insights.analyzer module."""
+    return pytest.importorskip("datacortex.insights.analyzer")
+
+
+@pytest.fixture(scope="session")
+def formatter():
+    """The datacortex.insights.formatter module."""
+    return pytest.importorskip("datacortex.insights.formatter")
+
+
+def mk_nodes(ids, **columns):
+    """Build one Node per id from per-field value lists.
+
+    title, path and space default to 'Doc <id>', '/<id>' and 'test'.
+    """
+    nodes = []
+    for i, node_id in enumerate(ids):
+        fields = {'title': f'Doc {node_id}', 'path': f'/{node_id}', 'space': 'test'}
+        fields.update((name, values[i]) for name, values in columns.items())
+        nodes.append(Node(id=node_id, **fields))
+    return nodes
+
+
+# Shared inputs; built once per module and never mutated by the tests
+
+@pytest.fixture(scope="module")
+def sample_nodes():
+    """Three nodes with word counts and centrality."""
+    return mk_nodes(['1', '2', '3'], word_count=[100, 200, 300], centrality=[0.1, 0.2, 0.3])
+
+
+@pytest.fixture(scope="module")
+def sample_edges():
+    """Resolved chain 1 -> 2 -> 3."""
+    return [
+        Edge(id='e1', source='1', target='2', resolved=True),
+        Edge(id='e2', source='2', target='3', resolved=True),
+    ]
+
+
+@pytest.fixture(scope="module")
+def hub_nodes():
+    """Nodes with distinct centrality for hub ranking."""
+    return mk_nodes(
+        ['1', '2', '3'],
+        title=['High Hub', 'Medium Hub', 'Low Hub'],
+        centrality=[0.9, 0.5, 0.1],
+        word_count=[500, 300, 100],
+        tags=[['important'], ['medium'], ['low']],
+    )
+
+
+@pytest.fixture(scope="module")
+def tagged_nodes():
+    """Nodes where 'ai' and 'data' are the most common tags."""
+    return mk_nodes(['1', '2', '3'], tags=[['ai', 'data'], ['ai', 'ml'], ['data', 'analytics']])
+
+
+@pytest.fixture(scope="module")
+def sample_clusters():
+    """Two clusters: nodes 1 and 2 in cluster 1, node 3 in cluster 2."""
+    return {
+        1: mk_nodes(['1', '2'], cluster_id=[1, 1]),
+        2: mk_nodes(['3'], cluster_id=[2]),
+    }
+
+
+@lru_cache(maxsize=None)
+def _mk_analysis(cluster_id: int = 1, size: int = 10):
+    """Build a fully populated ClusterAnalysis once per signature."""
+    from datacortex.insights.analyzer import ClusterAnalysis
+
+    return ClusterAnalysis(
+        cluster_id=cluster_id,
+        size=size,
         stats={'avg_words': 200, 'total_words': 2000, 'avg_centrality': 0.05, 'density': 0.1},
-        hubs=[{'title': 'Test Doc', 'centrality': 0.1, 'word_count': 500, 'tags': ['test'], 'path': '/test'}],
+        hubs=[{'title': 'Test Hub', 'centrality': 0.1, 'word_count': 500, 'tags': ['test'], 'path': '/test'}],
         tag_freq=[('test', 5), ('example', 3)],
         connections=[{'cluster_id': 2, 'link_count': 3}],
-        samples=[{'title': 'Test', 'word_count': 500, 'excerpt': 'Test content...'}]
+        samples=[{'title': 'Sample', 'word_count': 500, 'excerpt': 'Test content...'}]
+    )
+
+
+@lru_cache(maxsize=None)
+def _mk_result(cluster_ids: tuple[int, ...] = (1,), total_docs: int = 100, total_clusters: int = 5):
+    """Build an InsightsResult of _mk_analysis clusters once per signature."""
+    from datacortex.insights.analyzer import InsightsResult
+
+    return InsightsResult(
+        clusters=[_mk_analysis(cluster_id) for cluster_id in cluster_ids],
+        total_docs=total_docs,
+        total_clusters=total_clusters,
+        generated_at='2025-12-10T12:00:00'
     )
 
+
+@pytest.fixture(scope="module")
+def sample_analysis():
+    """A fully populated ClusterAnalysis."""
+    return _mk_analysis()
+
+
+@pytest.fixture(scope="module")
+def sample_result():
+    """InsightsResult holding sample_analysis."""
+    return _mk_result()
+
+
+def test_cluster_analysis_dataclass(sample_analysis):
+    """Test ClusterAnalysis dataclass creation."""
+    analysis = sample_analysis
+
     assert analysis.cluster_id == 1
     assert analysis.size == 10
     assert len(analysis.hubs) == 1
@@ -33,32 +132,16 @@ def test_cluster_analysis_dataclass():
 
 def test_insights_result_dataclass():
     """Test InsightsResult dataclass creation."""
-    result = InsightsResult(
-        clusters=[],
-        total_docs=100,
-        total_clusters=5,
-        generated_at='2025-12-10T12:00:00'
-    )
+    result = _mk_result(cluster_ids=())
 
     assert result.total_docs == 100
     assert result.total_clusters == 5
     assert len(result.clusters) == 0
 
 
-def test_get_cluster_stats():
+def test_get_cluster_stats(analyzer, sample_nodes, sample_edges):
     """Test cluster statistics computation."""
-    nodes = [
-        Node(id='1', title='Doc 1', path='/1', space='test', word_count=100, centrality=0.1),
-        Node(id='2', title='Doc 2', path='/2', space='test', word_count=200, centrality=0.2),
-        Node(id='3', title='Doc 3', path='/3', space='test', word_count=300, centrality=0.3),
-    ]
-
-    edges = [
-        Edge(id='e1', source='1', target='2', resolved=True),
-        Edge(id='e2', source='2', target='3', resolved=True),
-    ]
-
-    stats = get_cluster_stats(nodes, edges)
+    stats = analyzer.get_cluster_stats(sample_nodes, sample_edges)
 
     assert stats['total_words'] == 600
     assert stats['avg_words'] == 200
@@ -66,15 +149,22 @@ def test_get_cluster_stats():
     assert 'density' in stats
 
 
-def test_get_hub_documents():
-    """Test hub document extraction."""
-    nodes = [
-        Node(id='1', title='High Hub', path='/1', space='test', centrality=0.9, word_count=500, tags=['important']),
-        Node(id='2', title='Medium Hub', path='/2', space='test', centrality=0.5, word_count=300, tags=['medium']),
-        Node(id='3', title='Low Hub', path='/3', space='test', centrality=0.1, word_count=100, tags=['low']),
-    ]
+def test_get_cluster_stats_with_node_arrays(analyzer, sample_nodes, sample_edges):
+    """Test array-backed cluster stats match the object path."""
+    nodes = sample_nodes
+    edges = sample_edges[:1]
+    graph = Graph(nodes=nodes, edges=edges)
+
+    member_mask = np.array([True, True, False])
+    stats = analyzer.get_cluster_stats(nodes[:2], edges, graph.node_arrays, member_mask)
 
-    hubs = get_hub_documents(nodes, top_n=2)
+    assert stats == analyzer.get_cluster_stats(nodes[:2], edges)
+    assert stats['total_words'] == 300
+
+
+def test_get_hub_documents(analyzer, hub_nodes):
+    """Test hub document extraction."""
+    hubs = analyzer.get_hub_documents(hub_nodes, top_n=2)
 
     assert len(hubs) == 2
     assert hubs[0]['title'] == 'High Hub'
@@ -83,122 +173,77 @@ def test_get_hub_documents():
     assert 'word_count' in hubs[0]
 
 
-def test_get_tag_frequency():
+def test_get_tag_frequency(analyzer, tagged_nodes):
     """Test tag frequency counting."""
-    nodes = [
-        Node(id='1', title='Doc 1', path='/1', space='test', tags=['ai', 'data']),
-        Node(id='2', title='Doc 2', path='/2', space='test', tags=['ai', 'ml']),
-        Node(id='3', title='Doc 3', path='/3', space='test', tags=['data', 'analytics']),
-    ]
-
-    tag_freq = get_tag_frequency(nodes)
+    tag_freq = analyzer.get_tag_frequency(tagged_nodes)
 
     assert len(tag_freq) >= 2
-    # 'ai' and 'data' should be most common
-    tags_dict = dict(tag_freq)
-    assert tags_dict.get('ai') == 2
-    assert tags_dict.get('data') == 2
+    # 'ai' and 'data' should be most common, tied in first-seen order
+    assert tag_freq[:2] == [('ai', 2), ('data', 2)]
 
 
-def test_get_cluster_connections():
+def test_get_cluster_connections(analyzer, sample_clusters):
     """Test cluster connection analysis."""
-    clusters = {
-        1: [
-            Node(id='1', title='Doc 1', path='/1', space='test', cluster_id=1),
-            Node(id='2', title='Doc 2', path='/2', space='test', cluster_id=1),
-        ],
-        2: [
-            Node(id='3', title='Doc 3', path='/3', space='test', cluster_id=2),
-        ]
-    }
-
     edges = [
         Edge(id='e1', source='1', target='3', resolved=True),
         Edge(id='e2', source='2', target='3', resolved=True),
     ]
 
-    connections = get_cluster_connections(1, clusters, edges)
+    node_to_cluster = {node.id: cid for cid, members in sample_clusters.items() for node in members}
+
+    connections = analyzer.get_cluster_connections(1, node_to_cluster, edges)
 
     assert len(connections) > 0
     assert connections[0]['cluster_id'] == 2
     assert connections[0]['link_count'] == 2
 
 
-def test_format_insights():
-    """Test insights formatting."""
-    analysis = ClusterAnalysis(
-        cluster_id=1,
-        size=10,
-        stats={'avg_words': 200, 'total_words': 2000, 'avg_centrality': 0.05, 'density': 0.1},
-        hubs=[{'title': 'Test Hub', 'centrality': 0.1, 'word_count': 500, 'tags': ['test'], 'path': '/test'}],
-        tag_freq=[('test', 5)],
-        connections=[{'cluster_id': 2, 'link_count': 3}],
-        samples=[{'title': 'Sample', 'word_count': 500, 'excerpt': 'Test content...'}]
-    )
-
-    result = InsightsResult(
-        clusters=[analysis],
-        total_docs=100,
-        total_clusters=5,
-        generated_at='2025-12-10T12:00:00'
-    )
-
-    formatted = format_insights(result, include_samples=True)
-
-    assert 'CLUSTER_INSIGHTS' in formatted
-    assert 'total_docs=100' in formatted
-    assert 'CLUSTER id=1 size=10' in formatted
-    assert 'Test Hub' in formatted
-    assert 'test: 5' in formatted
-
-
-def test_format_insights_no_samples():
-    """Test insights formatting without samples."""
-    analysis = ClusterAnalysis(
-        cluster_id=1,
-        size=5,
-        stats={'avg_words': 100, 'total_words': 500, 'avg_centrality': 0.02, 'density': 0.05},
-        hubs=[],
-        tag_freq=[],
-        connections=[],
-        samples=[]
-    )
-
-    result = InsightsResult(
-        clusters=[analysis],
-        total_docs=50,
-        total_clusters=3,
-        generated_at='2025-12-10T12:00:00'
-    )
-
-    formatted = format_insights(result, include_samples=False)
+def test_get_cluster_connections_skips_internal_and_unclustered(analyzer):
+    """Test that internal edges and edges to unclustered nodes are not counted."""
+    node_to_cluster = {'1': 1, '2': 1, '3': 2}
 
-    assert 'CLUSTER id=1' in formatted
-    assert 'SAMPLES' not in formatted
-
-
-def test_format_cluster_summary():
-    """Test cluster summary formatting."""
-    analysis = ClusterAnalysis(
-        cluster_id=1,
-        size=10,
-        stats={},
-        hubs=[{'title': 'Main Hub', 'centrality': 0.1, 'word_count': 500, 'tags': [], 'path': '/test'}],
-        tag_freq=[('tag1', 5), ('tag2', 3)],
-        connections=[],
-        samples=[]
-    )
-
-    result = InsightsResult(
-        clusters=[analysis],
-        total_docs=100,
-        total_clusters=5,
-        generated_at='2025-12-10T12:00:00'
-    )
-
-    summary = format_cluster_summary(result)
+    edges = [
+        Edge(id='e1', source='1', target='2', resolved=True),
+        Edge(id='e2', source='3', target='1', resolved=True),
+        Edge(id='e3', source='1', target='missing', resolved=True),
+        Edge(id='e4', source='2', target='3', resolved=False),
+    ]
 
-    assert 'CLUSTER SUMMARY' in summary
-    assert 'Total clusters: 5' in summary
-    assert 'Total documents: 100' in summary
-    assert 'Main Hub' in summary
+    connections = analyzer.get_cluster_connections(1, node_to_cluster, edges)
+
+    assert connections == [{'cluster_id': 2, 'link_count': 1}]
+
+    # Array path gives the same result
+    nodes = mk_nodes(['1', '2', '3'])
+    graph = Graph(nodes=nodes, edges=edges)
+    cluster_of = np.array([node_to_cluster[nid] for nid in ('1', '2', '3')])
+
+    assert analyzer.get_cluster_connections_from_arrays(1, graph.edge_arrays, cluster_of) == connections
+
+
+@pytest.mark.parametrize("fmt,kwargs,must,must_not", [
+    (
+        'format_insights',
+        {'include_samples': True},
+        ['CLUSTER_INSIGHTS', 'total_docs=100', 'CLUSTER id=1 size=10', 'Test Hub', 'test: 5', 'SAMPLES'],
+        [],
+    ),
+    ('format_insights', {'include_samples': False}, ['CLUSTER id=1'], ['SAMPLES']),
+    (
+        'format_cluster_summary',
+        {},
+        ['CLUSTER SUMMARY', 'Total clusters: 5', 'Total documents: 100', 'Test Hub'],
+        [],
+    ),
+], ids=['insights', 'insights_no_samples', 'cluster_summary'])
+def test_format_output(formatter, sample_result, fmt, kwargs, must, must_not):
+    """Test insights and summary formatting."""
+    formatted = getattr(formatter, fmt)(sample_result, **kwargs)
+
+    # Single tokens are checked against the set of words, phrases against
+    # the raw text; forbidden text must not appear anywhere
+    words = set(formatted.split())
+    for text in must:
+        assert text in (formatted if ' ' in text else words)
+    for text in must_not:
+        assert text not in formatted
@@ -0,0 +1,57 @@
+"""Tests for the retrieval pipeline."""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from datacortex.qa.retriever import SpaceStore, _rank_stores
+
+
+def mk_store(space, ids, embeddings):
+    """Build a SpaceStore with neutral metadata around the given embeddings."""
+    n = len(ids)
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return SpaceStore(
+        space=space,
+        ids=list(ids),
+        id_to_row={file_id: i for i, file_id in enumerate(ids)},
+        embeddings=embeddings,
+        titles=list(ids),
+        paths=[f'/{space}/{file_id}' for file_id in ids],
+        types=['zettel'] * n,
+        updated_ts=np.full(n, -np.inf),
+        updated_naive=np.zeros(n, dtype=bool),
+        word_counts=[0] * n,
+        tags=[[] for _ in ids],
+        degrees=np.zeros(n, dtype=np.int64),
+        max_degree=1,
+    )
+
+
+def mk_conn(ids):
+    """In-memory database holding a files table with content for ids."""
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE files (id TEXT PRIMARY KEY, content TEXT)")
+    conn.executemany("INSERT INTO files VALUES (?, ?)", [(file_id, f'content {file_id}') for file_id in ids])
+    return conn
+
+
+def test_rank_stores_scores_duplicate_ids_once():
+    """A file ID present in two spaces is ranked once, from the later space."""
+    query = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+    first = mk_store('a', ['dup', 'a1'], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    second = mk_store('b', ['dup', 'b1'], [[0.9, 0.1, 0.0], [0.0, 0.0, 1.0]])
+    conns = {'a': mk_conn(first.ids), 'b': mk_conn(second.ids)}
+
+    results = _rank_stores(query, [first, second], top_k=5, expand=False, conns=conns)
+
+    file_ids = [result.file_id for result in results]
+    assert sorted(file_ids) == ['a1', 'b1', 'dup']
+    dup = results[file_ids.index('dup')]
+    assert dup.path == '/b/dup'
+    assert dup.vec_score == pytest.approx(float(second.embeddings[0] @ query))